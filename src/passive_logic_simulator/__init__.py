@@ -3,14 +3,23 @@
 Public API:
 - `load_config(...)` loads a TOML configuration into a `SimulationConfig`.
 - `run_simulation(...)` runs the transient model and returns a `SimulationResult`.
+- `run_simulation_batch(...)` runs several configurations (e.g. a parameter sweep).
+- `validate_batch(...)` checks a batch of configurations up front.
 """
 
 from passive_logic_simulator.config import SimulationConfig, load_config
-from passive_logic_simulator.simulation import SimulationResult, run_simulation
+from passive_logic_simulator.simulation import (
+    SimulationResult,
+    run_simulation,
+    run_simulation_batch,
+    validate_batch,
+)
 
 __all__ = [
     "SimulationConfig",
     "SimulationResult",
     "load_config",
     "run_simulation",
+    "run_simulation_batch",
+    "validate_batch",
 ]
@@ -6,13 +6,20 @@ Run with:
 
 from __future__ import annotations
 
+import hashlib
 import os
+import struct
+import sys
+import threading
+from array import array
+from collections import OrderedDict
 from pathlib import Path
 from typing import Literal
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -34,6 +41,11 @@ from passive_logic_simulator.weather import SyntheticWeatherConfig
 RATE_LIMIT = os.environ.get("RATE_LIMIT", "30/minute")
 limiter = Limiter(key_func=get_remote_address)
 
+# Result cache bounds: at most this many distinct requests, holding at most this many
+# time samples in total (~33 bytes each across the result series, so ~33 MB).
+RESULT_CACHE_SIZE = 128
+RESULT_CACHE_MAX_SAMPLES = 1_000_000
+
 app = FastAPI(
     title="Solar Thermal Simulation API",
     description="API for running solar collector + pump + tank simulations",
@@ -57,6 +69,9 @@ app.add_middleware(
     allow_headers=["Content-Type"],
 )
 
+# Compress larger responses (the JSON time series) for clients that accept gzip.
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 
 # Pydantic models for request/response
 class CollectorInput(BaseModel):
@@ -129,7 +144,7 @@ class SimulationRequest(BaseModel):
     control: ControlInput = Field(default_factory=ControlInput)
     simulation: SimulationInput = Field(default_factory=SimulationInput)
     weather: SyntheticWeatherInput = Field(default_factory=SyntheticWeatherInput)
-    solver: Literal["rk4", "euler"] = Field(
+    solver: Literal["rk4", "euler", "analytic", "dopri5"] = Field(
         default="rk4",
         description="Numerical integrator for T_tank(t)",
     )
@@ -196,29 +211,173 @@ def _build_simulation_config(request: SimulationRequest) -> SimulationConfig:
 def _build_simulation_response(result: SimulationResult) -> SimulationResponse:
     """Convert a `SimulationResult` to the API response model."""
     return SimulationResponse(
-        times_s=result.times_s,
-        tank_temperature_k=result.tank_temperature_k,
-        ambient_temperature_k=result.ambient_temperature_k,
-        irradiance_w_m2=result.irradiance_w_m2,
-        pump_on=result.pump_on,
+        times_s=result.times_s.tolist(),
+        tank_temperature_k=result.tank_temperature_k.tolist(),
+        ambient_temperature_k=result.ambient_temperature_k.tolist(),
+        irradiance_w_m2=result.irradiance_w_m2.tolist(),
+        pump_on=list(map(bool, result.pump_on)),
     )
 
 
-@app.post("/api/simulate", response_model=SimulationResponse)
-@limiter.limit(RATE_LIMIT)
-def simulate(request: Request, sim_request: SimulationRequest) -> SimulationResponse:
-    """Run a simulation with the provided parameters and return results."""
-    _ = request  # Required by rate limiter for IP extraction
+def _pack_simulation_result(result: SimulationResult) -> bytes:
+    """Pack a `SimulationResult` into a compact little-endian binary payload.
+
+    Layout: a `uint32` sample count `n` and 4 padding bytes, then `n` `float64`
+    `times_s` (full precision, so large `t0_s` values survive), then `n` `float32`
+    values for each of `tank_temperature_k`, `ambient_temperature_k` and
+    `irradiance_w_m2` (in that order), followed by `n` `uint8` pump states (0/1).
+    The 8-byte header keeps every block aligned for typed-array views.
+    """
+    times_s = array("d", result.times_s)
+    series = array("f", result.tank_temperature_k)
+    series.extend(array("f", result.ambient_temperature_k))
+    series.extend(array("f", result.irradiance_w_m2))
+    if sys.byteorder == "big":
+        times_s.byteswap()
+        series.byteswap()
+    header = struct.pack("<I4x", len(times_s))
+    # The pump trace is already a byte array of 0/1 flags.
+    return b"".join((header, times_s.tobytes(), series.tobytes(), result.pump_on.tobytes()))
+
+
+def _run_request(sim_request: SimulationRequest) -> SimulationResult:
+    """Run the simulation for a request, mapping failures to HTTP errors."""
     try:
         config = _build_simulation_config(sim_request)
-        result = run_simulation(config, solver=sim_request.solver)
-        return _build_simulation_response(result)
+        return run_simulation(config, solver=sim_request.solver)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail="Simulation failed") from exc
 
 
+class _ResultCache:
+    """Thread-safe LRU cache of simulation results, bounded by entries and total samples.
+
+    Runs are deterministic, so identical requests can share one result. A result
+    larger than the whole sample budget is not stored at all, so a single long,
+    fine-grained run cannot pin memory after its response has been sent.
+    """
+
+    def __init__(self, *, max_entries: int, max_samples: int) -> None:
+        self.max_entries = max_entries
+        self.max_samples = max_samples
+        self._entries: OrderedDict[str, SimulationResult] = OrderedDict()
+        self._samples = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> SimulationResult | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: str, result: SimulationResult) -> None:
+        n_samples = len(result.times_s)
+        if n_samples > self.max_samples:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._samples -= len(previous.times_s)
+            self._entries[key] = result
+            self._samples += n_samples
+            while len(self._entries) > self.max_entries or self._samples > self.max_samples:
+                _, evicted = self._entries.popitem(last=False)
+                self._samples -= len(evicted.times_s)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._samples = 0
+
+
+_result_cache = _ResultCache(max_entries=RESULT_CACHE_SIZE, max_samples=RESULT_CACHE_MAX_SAMPLES)
+
+
+def _request_key(sim_request: SimulationRequest) -> tuple[str, str]:
+    """Return the cache key for `sim_request` and the ETag derived from it.
+
+    The key is the canonical JSON dump of the request; it includes defaults, so
+    requests that only differ in omitted fields share a key. Runs are deterministic,
+    so the key identifies the result. The ETag is weak because the same result is
+    sent both gzip-compressed and uncompressed.
+    """
+    request_json = sim_request.model_dump_json()
+    etag = 'W/"' + hashlib.sha256(request_json.encode()).hexdigest()[:32] + '"'
+    return request_json, etag
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Return whether `If-None-Match` on `request` lists `etag` (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in header.split(","))
+
+
+def _cached_result(sim_request: SimulationRequest, request_json: str, *, refresh: bool) -> SimulationResult:
+    """Return the result for `sim_request`, keyed by `request_json` (see `_request_key`).
+
+    Args:
+        sim_request: Validated request payload.
+        request_json: Cache key for `sim_request`.
+        refresh: If `True`, bypass the cache and re-run the simulation.
+    """
+    result = None if refresh else _result_cache.get(request_json)
+    if result is None:
+        # Failed runs raise here and are therefore never cached.
+        result = _run_request(sim_request)
+        _result_cache.put(request_json, result)
+    return result
+
+
+@app.post("/api/simulate", response_model=SimulationResponse)
+@limiter.limit(RATE_LIMIT)
+def simulate(
+    request: Request,
+    response: Response,
+    sim_request: SimulationRequest,
+    refresh: bool = False,
+) -> SimulationResponse | Response:
+    """Run a simulation with the provided parameters and return results.
+
+    Results are cached per request payload; pass `?refresh=true` to force a re-run.
+    A request whose `If-None-Match` lists the response's ETag gets an empty `304`.
+    """
+    request_json, etag = _request_key(sim_request)
+    if not refresh and _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    result = _cached_result(sim_request, request_json, refresh=refresh)
+    response.headers["ETag"] = etag
+    return _build_simulation_response(result)
+
+
+@app.post("/api/simulate.bin")
+@limiter.limit(RATE_LIMIT)
+def simulate_binary(request: Request, sim_request: SimulationRequest, refresh: bool = False) -> Response:
+    """Run a simulation and return results as packed binary arrays.
+
+    See `_pack_simulation_result` for the payload layout (`float64` times, `float32`
+    series). It is several times smaller than the JSON response and can be read
+    with `Float64Array` / `Float32Array` / `Uint8Array` views.
+    Caching, `?refresh=true` and `If-None-Match` behave as for `/api/simulate`.
+    """
+    request_json, etag = _request_key(sim_request)
+    if not refresh and _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    result = _cached_result(sim_request, request_json, refresh=refresh)
+    return Response(
+        content=_pack_simulation_result(result),
+        media_type="application/octet-stream",
+        headers={"ETag": etag},
+    )
+
+
 # Serve frontend static files in production (when frontend/dist exists)
 # This must be mounted AFTER API routes to avoid catching /api/* requests
 _frontend_dist = Path(__file__).parent.parent.parent / "frontend" / "dist"
@@ -334,6 +493,9 @@ if _frontend_dist.exists():
         "parameters.yml",
     }
 
+    # Resolved once at import instead of on every fallback request (it hits the filesystem).
+    _dist_root = _frontend_dist.resolve()
+
     @app.get("/{path:path}")
     def serve_spa(path: str) -> FileResponse:
         """Serve the SPA index.html for client-side routing."""
@@ -356,8 +518,7 @@ if _frontend_dist.exists():
         if filename_orig in _blocked_files or filename_lower in _blocked_files:
             raise HTTPException(status_code=404, detail="Not found")
 
-        dist_root = _frontend_dist.resolve()
-        requested_path = (dist_root / path).resolve()
-        if requested_path.is_relative_to(dist_root) and requested_path.exists() and requested_path.is_file():
+        requested_path = (_dist_root / path).resolve()
+        if requested_path.is_relative_to(_dist_root) and requested_path.exists() and requested_path.is_file():
             return FileResponse(requested_path)
         return FileResponse(_frontend_dist / "index.html")
@@ -8,12 +8,12 @@ This module exposes a small `typer` app with two primary commands:
 
 from __future__ import annotations
 
-import csv
 import os
 import signal
 import subprocess
 import sys
 import time
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Annotated, Literal, Optional
 
@@ -31,13 +31,20 @@ app = typer.Typer(
 def _write_results_csv(
     output_path: Path,
     *,
-    times_s: list[float],
-    tank_temperature_k: list[float],
-    ambient_temperature_k: list[float],
-    irradiance_w_m2: list[float],
-    pump_on: list[bool],
+    times_s: Sequence[float],
+    tank_temperature_k: Sequence[float],
+    ambient_temperature_k: Sequence[float],
+    irradiance_w_m2: Sequence[float],
+    pump_on: Sequence[int],
+    significant_digits: int | None = None,
 ) -> None:
-    """Write simulation outputs to a CSV file suitable for plotting."""
+    """Write simulation outputs to a CSV file suitable for plotting.
+
+    Args:
+        significant_digits: If given, format float columns with this many
+            significant digits (e.g. `7` for float32-level precision) to shrink
+            the file. By default values are written at full float64 precision.
+    """
     n = len(times_s)
     lengths = {
         "tank_temperature_k": len(tank_temperature_k),
@@ -47,36 +54,30 @@ def _write_results_csv(
     }
     if any(length != n for length in lengths.values()):
         raise ValueError(f"Result series length mismatch: times_s={n}, {lengths}")
+    if significant_digits is not None and significant_digits < 1:
+        raise ValueError(f"significant_digits must be >= 1, got {significant_digits!r}")
+
+    if significant_digits is None:
+        # `str(float)` is the shortest round-tripping repr (same as the csv module).
+        row_fmt = "{},{},{},{},{:d}"
+    else:
+        g = f".{significant_digits}g"
+        row_fmt = f"{{:{g}}},{{:{g}}},{{:{g}}},{{:{g}}},{{:d}}"
+    format_row = row_fmt.format
+    header = "time_s,tank_temperature_k,ambient_temperature_k,irradiance_w_m2,pump_on"
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with output_path.open("w", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "time_s",
-                "tank_temperature_k",
-                "ambient_temperature_k",
-                "irradiance_w_m2",
-                "pump_on",
-            ],
-        )
-        writer.writeheader()
-        for t_s, t_tank_k, t_amb_k, g, on in zip(
-            times_s,
-            tank_temperature_k,
-            ambient_temperature_k,
-            irradiance_w_m2,
-            pump_on,
-        ):
-            writer.writerow(
-                {
-                    "time_s": t_s,
-                    "tank_temperature_k": t_tank_k,
-                    "ambient_temperature_k": t_amb_k,
-                    "irradiance_w_m2": g,
-                    "pump_on": int(on),
-                }
+        # Format all rows and write them in a single call (no per-row writer calls).
+        lines = [header]
+        lines.extend(
+            format_row(t_s, t_tank_k, t_amb_k, g_w_m2, on)
+            for t_s, t_tank_k, t_amb_k, g_w_m2, on in zip(
+                times_s, tank_temperature_k, ambient_temperature_k, irradiance_w_m2, pump_on
             )
+        )
+        lines.append("")
+        f.write("\r\n".join(lines))
 
 
 @app.command()
@@ -86,13 +87,23 @@ def run(
         typer.Option("--config", "-c", help="Path to TOML config file"),
     ] = Path("resources/default_config.toml"),
     solver: Annotated[
-        Literal["rk4", "euler"],
-        typer.Option("--solver", help="Numerical solver for the tank ODE: rk4 or euler"),
+        Literal["rk4", "euler", "analytic", "dopri5"],
+        typer.Option(
+            "--solver", help="Numerical solver for the tank ODE: rk4, euler, analytic, or dopri5 (adaptive)"
+        ),
     ] = "rk4",
     output_csv: Annotated[
         Path,
         typer.Option("--output-csv", "-o", help="Write results to CSV file"),
     ] = Path("out/simulation.csv"),
+    significant_digits: Annotated[
+        Optional[int],
+        typer.Option(
+            "--significant-digits",
+            min=1,
+            help="Round CSV floats to N significant digits (default: full precision)",
+        ),
+    ] = None,
 ) -> None:
     """Run a simulation with the given config and write results to CSV."""
     sim_config = load_config(config)
@@ -105,6 +116,7 @@ def run(
         ambient_temperature_k=result.ambient_temperature_k,
         irradiance_w_m2=result.irradiance_w_m2,
         pump_on=result.pump_on,
+        significant_digits=significant_digits,
     )
 
     typer.echo(f"Wrote {output_csv}")
@@ -10,11 +10,13 @@ definitions and units.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import tomllib
 
+from passive_logic_simulator.file_stamp import FileStamp
 from passive_logic_simulator.params import (
     CollectorParams,
     ControlParams,
@@ -25,7 +27,7 @@ from passive_logic_simulator.params import (
 from passive_logic_simulator.weather import CsvWeatherConfig, SyntheticWeatherConfig, WeatherConfig
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimulationConfig:
     """Fully specified configuration for a simulation run."""
 
@@ -49,6 +51,10 @@ def _require_mapping(value: Any, *, key_path: str) -> dict[str, Any]:
     return value
 
 
+# Sentinel for keys absent from a TOML table (a single `dict.get` per lookup).
+_MISSING = object()
+
+
 def _get_float(table: dict[str, Any], key: str, *, default: float | None = None, key_path: str) -> float:
     """Read a numeric value from a TOML table.
 
@@ -58,38 +64,38 @@ def _get_float(table: dict[str, Any], key: str, *, default: float | None = None,
         default: Optional default to use when `key` is missing.
         key_path: Dotted key path used for error messages.
     """
-    if key in table:
-        value = table[key]
-        if isinstance(value, (int, float)):
-            return float(value)
-        raise ValueError(f"Expected number at '{key_path}.{key}', got {type(value).__name__}")
-    if default is None:
-        raise ValueError(f"Missing required key '{key_path}.{key}'")
-    return default
+    value = table.get(key, _MISSING)
+    if value is _MISSING:
+        if default is None:
+            raise ValueError(f"Missing required key '{key_path}.{key}'")
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+    raise ValueError(f"Expected number at '{key_path}.{key}', got {type(value).__name__}")
 
 
 def _get_bool(table: dict[str, Any], key: str, *, default: bool | None = None, key_path: str) -> bool:
     """Read a boolean value from a TOML table."""
-    if key in table:
-        value = table[key]
-        if isinstance(value, bool):
-            return value
-        raise ValueError(f"Expected boolean at '{key_path}.{key}', got {type(value).__name__}")
-    if default is None:
-        raise ValueError(f"Missing required key '{key_path}.{key}'")
-    return default
+    value = table.get(key, _MISSING)
+    if value is _MISSING:
+        if default is None:
+            raise ValueError(f"Missing required key '{key_path}.{key}'")
+        return default
+    if isinstance(value, bool):
+        return value
+    raise ValueError(f"Expected boolean at '{key_path}.{key}', got {type(value).__name__}")
 
 
 def _get_str(table: dict[str, Any], key: str, *, default: str | None = None, key_path: str) -> str:
     """Read a string value from a TOML table."""
-    if key in table:
-        value = table[key]
-        if isinstance(value, str):
-            return value
-        raise ValueError(f"Expected string at '{key_path}.{key}', got {type(value).__name__}")
-    if default is None:
-        raise ValueError(f"Missing required key '{key_path}.{key}'")
-    return default
+    value = table.get(key, _MISSING)
+    if value is _MISSING:
+        if default is None:
+            raise ValueError(f"Missing required key '{key_path}.{key}'")
+        return default
+    if isinstance(value, str):
+        return value
+    raise ValueError(f"Expected string at '{key_path}.{key}', got {type(value).__name__}")
 
 
 def _parse_weather(config: dict[str, Any], *, base_dir: Path) -> WeatherConfig:
@@ -135,9 +141,20 @@ def _parse_weather(config: dict[str, Any], *, base_dir: Path) -> WeatherConfig:
 
 
 def load_config(path: str | Path) -> SimulationConfig:
-    """Load a TOML file and convert it into a typed `SimulationConfig`."""
-    path = Path(path)
-    raw = tomllib.loads(path.read_text(encoding="utf-8"))
+    """Load a TOML file and convert it into a typed `SimulationConfig`.
+
+    Parsed configs are cached per file version (see `FileStamp`).
+    """
+    # Relative `weather.csv_path` values resolve against the directory the config was
+    # loaded from (not a symlink's target), so that directory is part of the cache key.
+    base_dir = Path(path).absolute().parent
+    return _load_config_cached(FileStamp.of(path), base_dir)
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(stamp: FileStamp, base_dir: Path) -> SimulationConfig:
+    """Parse the file behind `stamp` into a `SimulationConfig` (memoized by `load_config`)."""
+    raw = tomllib.loads(stamp.path.read_text(encoding="utf-8"))
     root = _require_mapping(raw, key_path="root")
 
     collector_table = _require_mapping(root.get("collector", {}), key_path="collector")
@@ -188,7 +205,7 @@ def load_config(path: str | Path) -> SimulationConfig:
         duration_s=_get_float(sim_table, "duration_s", default=24 * 3600, key_path="simulation"),
     )
 
-    weather = _parse_weather(root, base_dir=path.parent)
+    weather = _parse_weather(root, base_dir=base_dir)
 
     return SimulationConfig(
         collector=collector,
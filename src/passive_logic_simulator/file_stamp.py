@@ -0,0 +1,29 @@
+"""Identify one version of a file on disk, for caching values parsed from it."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True, slots=True)
+class FileStamp:
+    """A resolved file path plus the `stat` fields that identify its current contents.
+
+    Used as an `lru_cache` key for values parsed from the file: editing the file
+    changes its modification time and/or size, so the next lookup misses and the
+    file is parsed again. A rewrite that keeps the same size within the
+    filesystem's timestamp granularity (coarse on e.g. FAT, HFS+ and some network
+    mounts) keeps the same stamp, so it can still return the previously parsed value.
+    """
+
+    path: Path
+    mtime_ns: int
+    size: int
+
+    @classmethod
+    def of(cls, path: str | Path) -> FileStamp:
+        """Resolve and `stat` `path` (raises `OSError`, e.g. `FileNotFoundError`)."""
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        return cls(resolved, stat.st_mtime_ns, stat.st_size)
@@ -34,3 +34,86 @@ def euler_step(
 ) -> float:
     """Advance a scalar ODE one fixed step using forward Euler."""
     return y + dt_s * f(t_s, y)
+
+
+# Dormand-Prince 5(4) coefficients (Hairer, Norsett & Wanner, "Solving ODEs I").
+_DP_C2, _DP_C3, _DP_C4, _DP_C5 = 1.0 / 5.0, 3.0 / 10.0, 4.0 / 5.0, 8.0 / 9.0
+_DP_A21 = 1.0 / 5.0
+_DP_A31, _DP_A32 = 3.0 / 40.0, 9.0 / 40.0
+_DP_A41, _DP_A42, _DP_A43 = 44.0 / 45.0, -56.0 / 15.0, 32.0 / 9.0
+_DP_A51, _DP_A52, _DP_A53, _DP_A54 = 19372.0 / 6561.0, -25360.0 / 2187.0, 64448.0 / 6561.0, -212.0 / 729.0
+_DP_A61, _DP_A62, _DP_A63, _DP_A64, _DP_A65 = (
+    9017.0 / 3168.0,
+    -355.0 / 33.0,
+    46732.0 / 5247.0,
+    49.0 / 176.0,
+    -5103.0 / 18656.0,
+)
+_DP_B1, _DP_B3, _DP_B4, _DP_B5, _DP_B6 = 35.0 / 384.0, 500.0 / 1113.0, 125.0 / 192.0, -2187.0 / 6784.0, 11.0 / 84.0
+# Difference between the 5th- and embedded 4th-order weights (local error estimate).
+_DP_E1, _DP_E3, _DP_E4, _DP_E5, _DP_E6, _DP_E7 = (
+    71.0 / 57600.0,
+    -71.0 / 16695.0,
+    71.0 / 1920.0,
+    -17253.0 / 339200.0,
+    22.0 / 525.0,
+    -1.0 / 40.0,
+)
+
+
+def dopri5_step(
+    t_s: float,
+    y: float,
+    dt_s: float,
+    f: Callable[[float, float], float],
+    k1: float,
+) -> tuple[float, float, float]:
+    """Advance a scalar ODE one step using the Dormand-Prince 5(4) pair.
+
+    The method is "first same as last": the returned end-point derivative is the
+    `k1` of the next step when the step is accepted.
+
+    Args:
+        t_s: Current time [s].
+        y: Current state value.
+        dt_s: Step size [s].
+        f: RHS function implementing `dy/dt = f(t, y)`.
+        k1: `f(t_s, y)`, the derivative at the start of the step.
+
+    Returns:
+        `(y_next, dydt_next, error)` where `y_next` is the 5th-order solution,
+        `dydt_next = f(t_s + dt_s, y_next)`, and `error` is the local error
+        estimate (difference to the embedded 4th-order solution).
+    """
+    h = dt_s
+    k2 = f(t_s + _DP_C2 * h, y + h * _DP_A21 * k1)
+    k3 = f(t_s + _DP_C3 * h, y + h * (_DP_A31 * k1 + _DP_A32 * k2))
+    k4 = f(t_s + _DP_C4 * h, y + h * (_DP_A41 * k1 + _DP_A42 * k2 + _DP_A43 * k3))
+    k5 = f(t_s + _DP_C5 * h, y + h * (_DP_A51 * k1 + _DP_A52 * k2 + _DP_A53 * k3 + _DP_A54 * k4))
+    k6 = f(t_s + h, y + h * (_DP_A61 * k1 + _DP_A62 * k2 + _DP_A63 * k3 + _DP_A64 * k4 + _DP_A65 * k5))
+    y_next = y + h * (_DP_B1 * k1 + _DP_B3 * k3 + _DP_B4 * k4 + _DP_B5 * k5 + _DP_B6 * k6)
+    k7 = f(t_s + h, y_next)
+    error = h * (_DP_E1 * k1 + _DP_E3 * k3 + _DP_E4 * k4 + _DP_E5 * k5 + _DP_E6 * k6 + _DP_E7 * k7)
+    return y_next, k7, error
+
+
+def hermite_interpolate(
+    t_s: float,
+    t0_s: float,
+    y0: float,
+    dydt0: float,
+    t1_s: float,
+    y1: float,
+    dydt1: float,
+) -> float:
+    """Evaluate the cubic Hermite interpolant through two points and their slopes at `t_s`."""
+    h = t1_s - t0_s
+    theta = (t_s - t0_s) / h
+    theta2 = theta * theta
+    theta3 = theta2 * theta
+    return (
+        (2.0 * theta3 - 3.0 * theta2 + 1.0) * y0
+        + (theta3 - 2.0 * theta2 + theta) * h * dydt0
+        + (3.0 * theta2 - 2.0 * theta3) * y1
+        + (theta3 - theta2) * h * dydt1
+    )
@@ -1,6 +1,6 @@
 """Typed parameter sets for the physical model.
 
-The simulator uses a small set of dataclasses to represent inputs. Parameters
+The simulator uses a small set of slotted dataclasses to represent inputs. Parameters
 are validated on construction so that downstream simulation code can assume
 basic invariants (e.g., positive masses and time steps).
 
@@ -40,7 +40,7 @@ def _require_unit_interval(name: str, value: float) -> None:
         raise ValueError(f"{name} must be in [0, 1], got {value!r}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CollectorParams:
     """Collector model parameters."""
 
@@ -56,7 +56,7 @@ class CollectorParams:
         _require_non_negative("collector.loss_coefficient_w_m2k", self.loss_coefficient_w_m2k)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TankParams:
     """Tank model parameters and initial conditions."""
 
@@ -74,7 +74,7 @@ class TankParams:
         _require_non_negative("tank.room_temperature_k", self.room_temperature_k)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PumpParams:
     """Pump/loop parameters."""
 
@@ -84,7 +84,7 @@ class PumpParams:
         _require_non_negative("pump.mass_flow_kg_s", self.mass_flow_kg_s)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ControlParams:
     """Controller settings for the pump."""
 
@@ -101,7 +101,7 @@ class ControlParams:
         _require_non_negative("control.min_irradiance_w_m2", self.min_irradiance_w_m2)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimulationParams:
     """Simulation timeline and fixed-step integration settings."""
 
@@ -31,6 +31,18 @@ def collector_useful_heat_w(
     return clamp_min(q_u, 0.0)
 
 
+def collector_useful_heat_from_coeffs_w(
+    t_in_k: float, t_amb_outdoor_k: float, irradiance_w_m2: float, a_fr_eta_m2: float, a_fr_ul_w_k: float, /
+) -> float:
+    """Compute `collector_useful_heat_w` from precomputed `A*F_R*eta0` and `A*F_R*U_L`.
+
+    Positional-only variant for per-step callers that already hold the two collector
+    coefficients (no keyword packing or `CollectorParams` lookups).
+    """
+    q_u = a_fr_eta_m2 * irradiance_w_m2 - a_fr_ul_w_k * (t_in_k - t_amb_outdoor_k)
+    return q_u if q_u >= 0.0 else 0.0
+
+
 def collector_outlet_k(*, t_in_k: float, q_u_w: float, m_dot_kg_s: float, cp_j_kgk: float) -> float:
     """Compute collector outlet temperature given inlet temperature and useful heat."""
     if m_dot_kg_s <= 0.0:
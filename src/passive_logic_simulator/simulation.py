@@ -3,137 +3,550 @@
 This module wires together:
 - weather inputs (`G(t)`, `T_amb(t)`)
 - pump hysteresis control (updated once per step)
-- fixed-step integration (Euler or RK4) of the single tank state `T_tank`
+- fixed-step integration (Euler, RK4, or the exact per-step solution of the
+  linear tank ODE) or adaptive Dormand-Prince 5(4) integration of the single
+  tank state `T_tank`
 """
 
 from __future__ import annotations
 
 import math
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Literal
 
 from passive_logic_simulator.config import SimulationConfig
-from passive_logic_simulator.control import update_pump_state
-from passive_logic_simulator.numerics import euler_step, rk4_step
-from passive_logic_simulator.physics import collector_outlet_k, collector_useful_heat_w, tank_dTdt_k_s
-from passive_logic_simulator.weather import build_weather
+from passive_logic_simulator.numerics import dopri5_step, hermite_interpolate
+from passive_logic_simulator.params import ControlParams, SimulationParams
+from passive_logic_simulator.physics import collector_useful_heat_from_coeffs_w
+from passive_logic_simulator.weather import Weather, WeatherConfig, build_weather, sample_weather_grid
 
 
 @dataclass(frozen=True)
 class SimulationResult:
-    """Time series produced by the simulator (suitable for plotting/export)."""
+    """Time series produced by the simulator (suitable for plotting/export).
 
-    times_s: list[float]
-    tank_temperature_k: list[float]
-    ambient_temperature_k: list[float]
-    irradiance_w_m2: list[float]
-    pump_on: list[bool]
+    Float series are `array("d")` buffers (the same storage as `TimeSeries`) and the
+    pump trace is an `array("B")` of 0/1 flags; they index and iterate like lists,
+    and `.tolist()` returns a plain list.
+    """
 
+    times_s: array[float]
+    tank_temperature_k: array[float]
+    ambient_temperature_k: array[float]
+    irradiance_w_m2: array[float]
+    pump_on: array[int]
 
-SolverName = Literal["rk4", "euler"]
 
+SolverName = Literal["rk4", "euler", "analytic", "dopri5"]
+SOLVER_NAMES: tuple[SolverName, ...] = ("rk4", "euler", "analytic", "dopri5")
 
-def run_simulation(config: SimulationConfig, *, solver: SolverName = "rk4") -> SimulationResult:
-    """Run a transient simulation and return the full trajectory.
+# Adaptive (`"dopri5"`) solver settings: local error tolerance on `T_tank` and the
+# largest internal step, which bounds how far apart the solver samples the weather.
+DOPRI5_ABS_TOL_K = 1e-4
+DOPRI5_MAX_STEP_S = 300.0
+
+
+def _controller_thresholds(control: ControlParams) -> dict[str, float]:
+    """Return the kernel's pump thresholds for `control`.
+
+    A disabled controller forces the pump on; this is expressed with `-inf`
+    thresholds so the kernels need no separate bypass branch.
+    """
+    if not control.enabled:
+        return dict(delta_t_on_k=-math.inf, delta_t_off_k=-math.inf, min_irradiance_w_m2=-math.inf)
+    return dict(
+        delta_t_on_k=control.delta_t_on_k,
+        delta_t_off_k=control.delta_t_off_k,
+        min_irradiance_w_m2=control.min_irradiance_w_m2,
+    )
+
+
+def _pump_decision(
+    pump_on: bool,
+    t_tank_k: float,
+    irradiance_w_m2: float,
+    t_amb_k: float,
+    a_fr_eta0: float,
+    a_fr_ul: float,
+    inv_mdot_cp: float,
+    min_irradiance_w_m2: float,
+    delta_t_on_k: float,
+    delta_t_off_k: float,
+) -> bool:
+    """Hysteresis controller (see `control.update_pump_state`) on pre-extracted scalars.
+
+    `a_fr_eta0 = A*F_R*eta0`, `a_fr_ul = A*F_R*U_L`, and `inv_mdot_cp = 1/(m_dot*c_p)`
+    (0 for zero flow). Pass `-inf` thresholds (see `_controller_thresholds`) to force
+    the pump on.
+    """
+    q_u_w = collector_useful_heat_from_coeffs_w(t_tank_k, t_amb_k, irradiance_w_m2, a_fr_eta0, a_fr_ul)
+    threshold_k = delta_t_off_k if pump_on else delta_t_on_k
+    return irradiance_w_m2 >= min_irradiance_w_m2 and t_tank_k + q_u_w * inv_mdot_cp > t_tank_k + threshold_k
+
+
+def _simulate_core(
+    irradiance_w_m2: list[float],
+    ambient_temperature_k: list[float],
+    irradiance_mid_w_m2: list[float],
+    ambient_mid_k: list[float],
+    *,
+    solver: Literal["rk4", "euler", "analytic"],
+    dt_s: float,
+    initial_temperature_k: float,
+    room_temperature_k: float,
+    mass_kg: float,
+    cp_j_kgk: float,
+    ua_w_k: float,
+    area_m2: float,
+    heat_removal_factor: float,
+    optical_efficiency: float,
+    loss_coefficient_w_m2k: float,
+    mass_flow_kg_s: float,
+    delta_t_on_k: float,
+    delta_t_off_k: float,
+    min_irradiance_w_m2: float,
+) -> tuple[list[float], list[bool]]:
+    """Integrate the tank state over the presampled output grid using plain floats only.
+
+    This is the hot loop of `run_simulation`. Parameters are unpacked from the
+    config dataclasses by the caller, and the collector/tank/controller equations
+    from `physics.py` and `control.py` as well as the RK4/Euler stages from
+    `numerics.py` are inlined so each step runs on local variables without
+    attribute lookups, closures, or function calls.
+
+    The kernel deliberately touches nothing but floats, bools, and lists of floats,
+    so it can be handed to a JIT (e.g. `numba.njit`) unchanged if one is ever
+    added; the package itself stays dependency-free.
 
     Args:
-        config: Fully specified simulation configuration.
-        solver: Fixed-step ODE solver for the tank state (`"rk4"` or `"euler"`).
+        irradiance_w_m2: `G(t)` sampled on the output grid `t0 + i*dt`.
+        ambient_temperature_k: `T_amb(t)` sampled on the output grid.
+        irradiance_mid_w_m2: `G(t)` at the step midpoints `t0 + (i + 1/2)*dt`
+            (RK4 only; may be empty for Euler).
+        ambient_mid_k: `T_amb(t)` at the step midpoints (RK4 only).
 
     Returns:
-        A `SimulationResult` containing one sample per time step, including the
-        initial state at `t0_s` and the final state at `t0_s + duration_s`.
+        `(tank_temperature_k, pump_on)` aligned with the output grid.
     """
-    weather = build_weather(config.weather)
+    use_rk4 = solver == "rk4"
+    use_analytic = solver == "analytic"
+    a_fr = area_m2 * heat_removal_factor
+    a_fr_ul = a_fr * loss_coefficient_w_m2k
+    # With the pump on, `(m_dot/m) * (T_out - T)` reduces to `Q_u / (m*c_p)`; with a
+    # zero design flow the pump moves nothing, so the collector term always vanishes.
+    on_gain_k_s_w = 1.0 / (mass_kg * cp_j_kgk) if mass_flow_kg_s > 0.0 else 0.0
+    loss_rate_1_s = ua_w_k / (mass_kg * cp_j_kgk)
+    # Nominal outlet lift per watt, `1/(m_dot*c_p)`; zero flow gives no lift (`T_out = T_in`).
+    inv_mdot_cp = 1.0 / (mass_flow_kg_s * cp_j_kgk) if mass_flow_kg_s > 0.0 else 0.0
+    half_dt_s = 0.5 * dt_s
+    sixth_dt_s = dt_s / 6.0
+    # With no circulation the tank relaxes to `T_room` at a constant rate, which
+    # integrates exactly: `T(t + dt) = T_room + (T - T_room) * exp(-UA/(m*c_p) * dt)`.
+    off_decay = math.exp(-loss_rate_1_s * dt_s)
+    # With the pump on and `Q_u > 0`, `dT/dt = alpha - beta*T` where
+    # `beta = A*F_R*U_L/(m*c_p) + UA/(m*c_p)` is constant and `alpha` only depends on
+    # the weather. The exact step is `T += (alpha - beta*T) * (1 - exp(-beta*dt))/beta`;
+    # `expm1` keeps that factor accurate (-> `dt`) when `beta*dt` is tiny, where the
+    # `T_inf = alpha/beta` form would cancel catastrophically.
+    on_beta_1_s = on_gain_k_s_w * a_fr * loss_coefficient_w_m2k + loss_rate_1_s
+    on_step_s = -math.expm1(-on_beta_1_s * dt_s) / on_beta_1_s if on_beta_1_s > 0.0 else dt_s
 
-    times_s: list[float] = []
-    tank_temperature_k: list[float] = []
-    ambient_temperature_k: list[float] = []
-    irradiance_w_m2: list[float] = []
-    pump_on_series: list[bool] = []
+    # `Q_u = A*F_R*(eta0*G - U_L*(T - T_amb))` splits into a weather-only source term
+    # `A*F_R*(eta0*G + U_L*T_amb)`, computed for the whole grid in one pass, and a
+    # tank term `A*F_R*U_L*T`, leaving a single multiply-subtract per stage.
+    a_fr_eta0 = a_fr * optical_efficiency
+    source_w = [a_fr_eta0 * g + a_fr_ul * t_amb_k for g, t_amb_k in zip(irradiance_w_m2, ambient_temperature_k)]
+    source_mid_w = [a_fr_eta0 * g + a_fr_ul * t_amb_k for g, t_amb_k in zip(irradiance_mid_w_m2, ambient_mid_k)]
 
-    t_s = config.sim.t0_s
-    t_tank_k = config.tank.initial_temperature_k
-    pump_on = False
-
-    # Fixed-step integration; `pump_on` is updated once per step and held constant
-    # during all RK4 sub-stages for that step (per README/AGENTS conventions).
-    n_steps_float = config.sim.duration_s / config.sim.dt_s
-    n_steps = int(round(n_steps_float))
-    if not math.isclose(n_steps_float, n_steps, rel_tol=0.0, abs_tol=1e-12):
-        raise ValueError("simulation.duration_s must be an integer multiple of simulation.dt_s")
+    n_steps = len(irradiance_w_m2) - 1
+    # Outputs are preallocated and filled by index (no per-step list growth).
+    tank_temperature_k = [0.0] * (n_steps + 1)
+    pump_on_series = [False] * (n_steps + 1)
 
-    if solver not in {"rk4", "euler"}:
-        raise ValueError("solver must be one of: 'rk4', 'euler'")
+    t_tank_k = initial_temperature_k
+    pump_on = False
 
     for step in range(n_steps + 1):
-        g = weather.irradiance_w_m2(t_s)
-        t_amb_k = weather.ambient_temperature_k(t_s)
-
-        pump_on = update_pump_state(
-            pump_on=pump_on,
-            t_tank_k=t_tank_k,
-            t_amb_outdoor_k=t_amb_k,
-            irradiance_w_m2=g,
-            collector=config.collector,
-            pump=config.pump,
-            tank=config.tank,
-            control=config.control,
+        # Useful collector heat at the step start: the controller uses it for the nominal
+        # outlet temperature, and the integrator reuses it as the k1 collector term.
+        q_u_w = source_w[step] - a_fr_ul * t_tank_k
+        if q_u_w < 0.0:
+            q_u_w = 0.0
+
+        # Hysteresis controller (see `_pump_decision`), inlined.
+        pump_on = irradiance_w_m2[step] >= min_irradiance_w_m2 and (
+            t_tank_k + q_u_w * inv_mdot_cp > t_tank_k + (delta_t_off_k if pump_on else delta_t_on_k)
         )
 
-        times_s.append(t_s)
-        tank_temperature_k.append(t_tank_k)
-        ambient_temperature_k.append(t_amb_k)
-        irradiance_w_m2.append(g)
-        pump_on_series.append(pump_on)
+        tank_temperature_k[step] = t_tank_k
+        pump_on_series[step] = pump_on
 
         if step == n_steps:
             break
 
-        m_dot_kg_s = config.pump.mass_flow_kg_s if pump_on else 0.0
-        t_room_k = config.tank.room_temperature_k
-
-        def rhs(
-            local_t_s: float,
-            local_t_tank_k: float,
-            *,
-            m_dot_kg_s: float = m_dot_kg_s,
-            t_room_k: float = t_room_k,
-        ) -> float:
-            # Within a step, the pump state is constant; weather inputs can vary with time.
-            local_g = weather.irradiance_w_m2(local_t_s)
-            local_t_amb_k = weather.ambient_temperature_k(local_t_s)
-
-            q_u_w = collector_useful_heat_w(
-                t_in_k=local_t_tank_k,
-                t_amb_outdoor_k=local_t_amb_k,
-                irradiance_w_m2=local_g,
-                collector=config.collector,
-            )
-            t_out_k = collector_outlet_k(
-                t_in_k=local_t_tank_k,
-                q_u_w=q_u_w,
-                m_dot_kg_s=m_dot_kg_s,
-                cp_j_kgk=config.tank.cp_j_kgk,
-            )
-            return tank_dTdt_k_s(
-                t_tank_k=local_t_tank_k,
-                t_out_k=t_out_k,
-                t_room_k=t_room_k,
-                m_dot_kg_s=m_dot_kg_s,
-                tank=config.tank,
+        # The pump state is held for the whole step; with no flow the collector term vanishes.
+        gain = on_gain_k_s_w if pump_on else 0.0
+        if use_analytic:
+            if gain == 0.0 or q_u_w == 0.0:
+                # No useful heat reaches the tank: only the room losses act.
+                t_tank_k = room_temperature_k + (t_tank_k - room_temperature_k) * off_decay
+            else:
+                # Exact step of `dT/dt = alpha - beta*T`, holding the collector source at the
+                # mean of the two step-end samples (the `Q_u` clamp is taken at the step start).
+                alpha_k_s = gain * 0.5 * (source_w[step] + source_w[step + 1]) + loss_rate_1_s * room_temperature_k
+                t_tank_k += (alpha_k_s - on_beta_1_s * t_tank_k) * on_step_s
+            continue
+        if use_rk4 and gain == 0.0:
+            # Pump-off step: use the exact decay instead of four RK4 stages.
+            t_tank_k = room_temperature_k + (t_tank_k - room_temperature_k) * off_decay
+            continue
+
+        # Stage derivatives are written out inline (no per-step closure or RHS calls).
+        k1 = gain * q_u_w - loss_rate_1_s * (t_tank_k - room_temperature_k)
+        if not use_rk4:
+            t_tank_k += dt_s * k1
+            continue
+
+        s_mid_w = source_mid_w[step]
+
+        y2 = t_tank_k + half_dt_s * k1
+        q_u_w = s_mid_w - a_fr_ul * y2
+        k2 = gain * (q_u_w if q_u_w > 0.0 else 0.0) - loss_rate_1_s * (y2 - room_temperature_k)
+
+        y3 = t_tank_k + half_dt_s * k2
+        q_u_w = s_mid_w - a_fr_ul * y3
+        k3 = gain * (q_u_w if q_u_w > 0.0 else 0.0) - loss_rate_1_s * (y3 - room_temperature_k)
+
+        y4 = t_tank_k + dt_s * k3
+        q_u_w = source_w[step + 1] - a_fr_ul * y4
+        k4 = gain * (q_u_w if q_u_w > 0.0 else 0.0) - loss_rate_1_s * (y4 - room_temperature_k)
+
+        t_tank_k += sixth_dt_s * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+
+    return tank_temperature_k, pump_on_series
+
+
+def _simulate_adaptive(
+    weather: Weather,
+    times_s: list[float],
+    irradiance_w_m2: list[float],
+    ambient_temperature_k: list[float],
+    *,
+    initial_temperature_k: float,
+    room_temperature_k: float,
+    mass_kg: float,
+    cp_j_kgk: float,
+    ua_w_k: float,
+    area_m2: float,
+    heat_removal_factor: float,
+    optical_efficiency: float,
+    loss_coefficient_w_m2k: float,
+    mass_flow_kg_s: float,
+    delta_t_on_k: float,
+    delta_t_off_k: float,
+    min_irradiance_w_m2: float,
+    abs_tol_k: float = DOPRI5_ABS_TOL_K,
+    max_step_s: float = DOPRI5_MAX_STEP_S,
+) -> tuple[list[float], list[bool]]:
+    """Integrate the tank state with adaptive Dormand-Prince 5(4) steps.
+
+    Internal steps are chosen by a PI step-size controller (up to `max_step_s`)
+    and are independent of the output grid. The tank temperature at each output
+    time is read from a cubic Hermite interpolant of the accepted step, and the
+    pump controller is still evaluated once per output time. When the pump
+    switches, integration restarts from that output time so the pump state stays
+    constant within every internal step.
+
+    Returns:
+        `(tank_temperature_k, pump_on)` aligned with `times_s`.
+    """
+    irradiance_at = weather.irradiance_w_m2
+    ambient_at = weather.ambient_temperature_k
+    a_fr = area_m2 * heat_removal_factor
+    on_gain_k_s_w = 1.0 / (mass_kg * cp_j_kgk) if mass_flow_kg_s > 0.0 else 0.0
+    loss_rate_1_s = ua_w_k / (mass_kg * cp_j_kgk)
+    inv_mdot_cp = 1.0 / (mass_flow_kg_s * cp_j_kgk) if mass_flow_kg_s > 0.0 else 0.0
+    a_fr_eta0 = a_fr * optical_efficiency
+    a_fr_ul = a_fr * loss_coefficient_w_m2k
+
+    # The RHS is specialized by pump state once per run: with the pump off (or zero
+    # flow) only the room losses remain, so no weather lookups are needed.
+    def rhs_on(local_t_s: float, local_t_tank_k: float) -> float:
+        q_u_w = a_fr_eta0 * irradiance_at(local_t_s) - a_fr_ul * (local_t_tank_k - ambient_at(local_t_s))
+        return on_gain_k_s_w * (q_u_w if q_u_w > 0.0 else 0.0) - loss_rate_1_s * (
+            local_t_tank_k - room_temperature_k
+        )
+
+    def rhs_off(local_t_s: float, local_t_tank_k: float) -> float:
+        return -loss_rate_1_s * (local_t_tank_k - room_temperature_k)
+
+    controller = (a_fr_eta0, a_fr_ul, inv_mdot_cp, min_irradiance_w_m2, delta_t_on_k, delta_t_off_k)
+
+    n_steps = len(times_s) - 1
+    tank_temperature_k = [0.0] * (n_steps + 1)
+    pump_on_series = [False] * (n_steps + 1)
+
+    t_s = times_s[0]
+    t_tank_k = initial_temperature_k
+    pump_on = _pump_decision(False, t_tank_k, irradiance_w_m2[0], ambient_temperature_k[0], *controller)
+    tank_temperature_k[0] = t_tank_k
+    pump_on_series[0] = pump_on
+    if n_steps == 0:
+        return tank_temperature_k, pump_on_series
+
+    t_end_s = times_s[-1]
+    # Output times within `eps_s` of a step end are treated as landing on it.
+    eps_s = 1e-9 * (times_s[1] - times_s[0])
+    rhs = rhs_on if pump_on and on_gain_k_s_w > 0.0 else rhs_off
+    k1 = rhs(t_s, t_tank_k)
+    h_s = min(max_step_s, times_s[1] - times_s[0])
+    prev_error_ratio = 1.0
+    step = 0  # index of the last filled output sample
+    while step < n_steps:
+        h_s = min(h_s, max_step_s, t_end_s - t_s)
+        y_next, k_next, error = dopri5_step(t_s, t_tank_k, h_s, rhs, k1)
+        error_ratio = abs(error) / abs_tol_k
+        if error_ratio > 1.0:
+            # Reject and retry with a smaller step.
+            h_s *= max(0.2, 0.9 * error_ratio**-0.2)
+            continue
+
+        t_next_s = t_s + h_s
+        switched = False
+        while step < n_steps and times_s[step + 1] <= t_next_s + eps_s:
+            step += 1
+            t_out_s = times_s[step]
+            if t_out_s >= t_next_s:
+                t_out_k = y_next
+            else:
+                t_out_k = hermite_interpolate(t_out_s, t_s, t_tank_k, k1, t_next_s, y_next, k_next)
+            new_pump_on = _pump_decision(
+                pump_on, t_out_k, irradiance_w_m2[step], ambient_temperature_k[step], *controller
             )
+            tank_temperature_k[step] = t_out_k
+            pump_on_series[step] = new_pump_on
+            if new_pump_on != pump_on:
+                # Restart from the switching time with the new flow rate.
+                pump_on = new_pump_on
+                rhs = rhs_on if pump_on and on_gain_k_s_w > 0.0 else rhs_off
+                t_s = t_out_s
+                t_tank_k = t_out_k
+                k1 = rhs(t_s, t_tank_k)
+                switched = True
+                break
+        if not switched:
+            t_s, t_tank_k, k1 = t_next_s, y_next, k_next
 
-        if solver == "rk4":
-            t_tank_k = rk4_step(t_s, t_tank_k, config.sim.dt_s, rhs)
-        else:
-            t_tank_k = euler_step(t_s, t_tank_k, config.sim.dt_s, rhs)
-        t_s += config.sim.dt_s
+        # PI step-size control (Hairer & Wanner, beta = 0.04).
+        error_ratio = max(error_ratio, 1e-10)
+        factor = 0.9 * error_ratio**-0.17 * prev_error_ratio**0.04
+        h_s *= min(10.0, max(0.2, factor))
+        prev_error_ratio = error_ratio
 
-    return SimulationResult(
+    return tank_temperature_k, pump_on_series
+
+
+@dataclass(frozen=True)
+class _WeatherSamples:
+    """Weather inputs presampled on a simulation time grid."""
+
+    weather: Weather
+    times_s: list[float]
+    irradiance_w_m2: list[float]
+    ambient_temperature_k: list[float]
+    irradiance_mid_w_m2: list[float]  # at step midpoints (RK4 only)
+    ambient_mid_k: list[float]  # at step midpoints (RK4 only)
+
+
+def _check_solver(solver: str) -> None:
+    """Validate the solver name."""
+    if solver not in SOLVER_NAMES:
+        raise ValueError("solver must be one of: " + ", ".join(f"'{name}'" for name in SOLVER_NAMES))
+
+
+def _step_count(sim: SimulationParams) -> int:
+    """Return the number of `dt_s` steps in `sim`, validating the timeline."""
+    n_steps_float = sim.duration_s / sim.dt_s
+    n_steps = int(round(n_steps_float))
+    if not math.isclose(n_steps_float, n_steps, rel_tol=0.0, abs_tol=1e-12):
+        raise ValueError("simulation.duration_s must be an integer multiple of simulation.dt_s")
+    return n_steps
+
+
+def _sample_inputs(sim: SimulationParams, weather_config: WeatherConfig, *, solver: SolverName) -> _WeatherSamples:
+    """Build the time grid for `sim` and sample the weather on it."""
+    weather = build_weather(weather_config)
+
+    # Fixed-step integration; `pump_on` is updated once per step and held constant
+    # during all RK4 sub-stages for that step (per README/AGENTS conventions).
+    n_steps = _step_count(sim)
+
+    # Sample weather on the whole output grid up front; the step loop only indexes it.
+    # Times are computed as `t0 + i*dt` (not accumulated) so they do not drift.
+    times_s = [sim.t0_s + i * sim.dt_s for i in range(n_steps + 1)]
+    if solver == "rk4":
+        # RK4 also needs `t + dt/2` for k2/k3: sample grid points and midpoints in a
+        # single pass over the interleaved half-step grid `t0 + k*dt/2`, then split.
+        irradiance_all, ambient_all = sample_weather_grid(weather, sim.t0_s, 0.5 * sim.dt_s, 2 * n_steps + 1)
+        return _WeatherSamples(
+            weather=weather,
+            times_s=times_s,
+            irradiance_w_m2=irradiance_all[::2],
+            ambient_temperature_k=ambient_all[::2],
+            irradiance_mid_w_m2=irradiance_all[1::2],
+            ambient_mid_k=ambient_all[1::2],
+        )
+    irradiance_w_m2, ambient_temperature_k = sample_weather_grid(weather, sim.t0_s, sim.dt_s, n_steps + 1)
+    return _WeatherSamples(
+        weather=weather,
         times_s=times_s,
-        tank_temperature_k=tank_temperature_k,
-        ambient_temperature_k=ambient_temperature_k,
         irradiance_w_m2=irradiance_w_m2,
-        pump_on=pump_on_series,
+        ambient_temperature_k=ambient_temperature_k,
+        irradiance_mid_w_m2=[],
+        ambient_mid_k=[],
+    )
+
+
+def _integrate(config: SimulationConfig, samples: _WeatherSamples, *, solver: SolverName) -> SimulationResult:
+    """Run the kernel for `config` on presampled weather and wrap the result."""
+    params = dict(
+        initial_temperature_k=config.tank.initial_temperature_k,
+        room_temperature_k=config.tank.room_temperature_k,
+        mass_kg=config.tank.mass_kg,
+        cp_j_kgk=config.tank.cp_j_kgk,
+        ua_w_k=config.tank.ua_w_k,
+        area_m2=config.collector.area_m2,
+        heat_removal_factor=config.collector.heat_removal_factor,
+        optical_efficiency=config.collector.optical_efficiency,
+        loss_coefficient_w_m2k=config.collector.loss_coefficient_w_m2k,
+        mass_flow_kg_s=config.pump.mass_flow_kg_s,
+        **_controller_thresholds(config.control),
     )
+    if solver == "dopri5":
+        tank_temperature_k, pump_on_series = _simulate_adaptive(
+            samples.weather,
+            samples.times_s,
+            samples.irradiance_w_m2,
+            samples.ambient_temperature_k,
+            **params,
+        )
+    else:
+        tank_temperature_k, pump_on_series = _simulate_core(
+            samples.irradiance_w_m2,
+            samples.ambient_temperature_k,
+            samples.irradiance_mid_w_m2,
+            samples.ambient_mid_k,
+            solver=solver,
+            dt_s=config.sim.dt_s,
+            **params,
+        )
+
+    return SimulationResult(
+        times_s=array("d", samples.times_s),
+        tank_temperature_k=array("d", tank_temperature_k),
+        ambient_temperature_k=array("d", samples.ambient_temperature_k),
+        irradiance_w_m2=array("d", samples.irradiance_w_m2),
+        pump_on=array("B", pump_on_series),
+    )
+
+
+def run_simulation(config: SimulationConfig, *, solver: SolverName = "rk4") -> SimulationResult:
+    """Run a transient simulation and return the full trajectory.
+
+    Args:
+        config: Fully specified simulation configuration.
+        solver: ODE solver for the tank state: fixed-step `"rk4"` or `"euler"`,
+            `"analytic"` (exact solution of the linear tank ODE per step), or
+            adaptive `"dopri5"` (Dormand-Prince 5(4) with dense output on the grid).
+
+    Returns:
+        A `SimulationResult` containing one sample per time step, including the
+        initial state at `t0_s` and the final state at `t0_s + duration_s`.
+    """
+    _check_solver(solver)
+    samples = _sample_inputs(config.sim, config.weather, solver=solver)
+    return _integrate(config, samples, solver=solver)
+
+
+def validate_batch(configs: Sequence[SimulationConfig]) -> None:
+    """Check that every configuration in a batch can be simulated, before running any.
+
+    Parameter sets are already validated when they are constructed; this adds the
+    checks that otherwise only fail once a run starts (currently the
+    `duration_s`/`dt_s` timeline). Each distinct timeline is checked once.
+
+    Raises:
+        ValueError: For the first invalid configuration, prefixed with its index.
+    """
+    checked: set[SimulationParams] = set()
+    for index, config in enumerate(configs):
+        if config.sim in checked:
+            continue
+        try:
+            _step_count(config.sim)
+        except ValueError as exc:
+            raise ValueError(f"configs[{index}]: {exc}") from exc
+        checked.add(config.sim)
+
+
+def _run_batch_chunk(configs: Sequence[SimulationConfig], solver: SolverName) -> list[SimulationResult]:
+    """Run `configs` in order, sharing weather samples between equal inputs."""
+    samples_by_inputs: dict[tuple[SimulationParams, WeatherConfig], _WeatherSamples] = {}
+    results: list[SimulationResult] = []
+    for config in configs:
+        key = (config.sim, config.weather)
+        samples = samples_by_inputs.get(key)
+        if samples is None:
+            samples = _sample_inputs(config.sim, config.weather, solver=solver)
+            samples_by_inputs[key] = samples
+        results.append(_integrate(config, samples, solver=solver))
+    return results
+
+
+def run_simulation_batch(
+    configs: Sequence[SimulationConfig],
+    *,
+    solver: SolverName = "rk4",
+    max_workers: int | None = None,
+) -> list[SimulationResult]:
+    """Run several simulations (e.g. a parameter sweep) and return their trajectories.
+
+    Configurations that share the same timeline (`sim`) and weather settings reuse
+    a single time grid and weather sampling pass, so sweeps over collector, tank,
+    pump, or control parameters only pay for the integration of each scenario.
+
+    Args:
+        configs: Simulation configurations, one per scenario.
+        solver: ODE solver for the tank state: fixed-step `"rk4"` or `"euler"`,
+            `"analytic"` (exact solution of the linear tank ODE per step), or
+            adaptive `"dopri5"` (Dormand-Prince 5(4) with dense output on the grid).
+        max_workers: If greater than 1, scenarios are split into contiguous chunks
+            and run in up to this many worker processes. `None` (default) or 1
+            runs everything in the current process.
+
+    Returns:
+        One `SimulationResult` per entry of `configs`, in the same order.
+
+    Raises:
+        ValueError: If any configuration is invalid (see `validate_batch`); no
+            scenario is run in that case.
+    """
+    _check_solver(solver)
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers!r}")
+    configs = list(configs)
+    validate_batch(configs)
+    if max_workers is None or max_workers == 1 or len(configs) < 2:
+        return _run_batch_chunk(configs, solver)
+
+    # Scenarios are independent; contiguous chunks keep weather sampling shared
+    # within each worker while the GIL-bound integration runs on separate cores.
+    n_chunks = min(max_workers, len(configs))
+    bounds = [len(configs) * i // n_chunks for i in range(n_chunks + 1)]
+    chunks = [configs[lo:hi] for lo, hi in zip(bounds, bounds[1:])]
+    with ProcessPoolExecutor(max_workers=n_chunks) as executor:
+        chunk_results = executor.map(_run_batch_chunk, chunks, [solver] * n_chunks)
+        return [result for chunk in chunk_results for result in chunk]
@@ -7,34 +7,73 @@ linear interpolation over a strictly increasing time grid.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import copy
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from operator import ge
 from typing import Literal
 
 
 ExtrapolationMode = Literal["clamp", "zero", "error"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeSeries:
     """A 1D time series with linear interpolation.
 
     - `times_s` must be strictly increasing and expressed in seconds.
     - `values` is the corresponding scalar value at each time.
 
+    Any sequence of floats is accepted for both; they are stored as `array("d")`
+    buffers, which hold raw doubles (8 bytes per sample) instead of a `float` object
+    each, so large weather files stay compact in memory.
+
     Interpolation is linear between adjacent points. Behavior outside the time
     span is controlled by `extrapolation` in `value_at`.
     """
 
-    times_s: list[float]
-    values: list[float]
+    times_s: array[float]
+    values: array[float]
+    # End index of the segment found by the last `value_at` call. Queries usually move
+    # forward in time, so the next one tends to hit the same or the following segment.
+    # A one-element list keeps the hint mutable on a frozen instance; it is only a
+    # hint (always re-checked), so concurrent use can cost a bisect but not correctness.
+    _hint: list[int] = field(default_factory=lambda: [1], init=False, repr=False, compare=False)
+    # Per-segment slopes `(v[i+1] - v[i]) / (t[i+1] - t[i])`, so a lookup needs no division.
+    _slopes: array[float] = field(init=False, repr=False, compare=False)
+    # `(times_s[0], times_s[-1])` as plain floats, so the range check in `value_at` does
+    # not index (and box) the array on every call.
+    _span_s: tuple[float, float] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        object.__setattr__(self, "times_s", array("d", self.times_s))
+        object.__setattr__(self, "values", array("d", self.values))
         if len(self.times_s) != len(self.values):
             raise ValueError("TimeSeries.times_s and TimeSeries.values must have the same length")
         if len(self.times_s) < 2:
             raise ValueError("TimeSeries must have at least 2 points")
-        if any(t2 <= t1 for t1, t2 in zip(self.times_s, self.times_s[1:])):
+        # `map(ge, ...)` compares adjacent knots in C, without a tuple or generator frame per pair.
+        if any(map(ge, self.times_s, self.times_s[1:])):
             raise ValueError("TimeSeries.times_s must be strictly increasing")
+        object.__setattr__(self, "_slopes", _segment_slopes(self.times_s, self.values))
+        object.__setattr__(self, "_span_s", (self.times_s[0], self.times_s[-1]))
+
+    def with_values(self, values: Sequence[float]) -> TimeSeries:
+        """Return a series with new `values` on this series' time axis.
+
+        The (already validated) `times_s` buffer is shared instead of copied and
+        re-checked, e.g. for several weather channels sampled at the same times.
+        """
+        values = array("d", values)
+        if len(values) != len(self.times_s):
+            raise ValueError("TimeSeries.times_s and TimeSeries.values must have the same length")
+        series = copy.copy(self)
+        object.__setattr__(series, "values", values)
+        object.__setattr__(series, "_hint", [1])
+        object.__setattr__(series, "_slopes", _segment_slopes(self.times_s, values))
+        return series
 
     def value_at(self, t_s: float, *, extrapolation: ExtrapolationMode = "clamp") -> float:
         """Return the interpolated value at time `t_s`.
@@ -46,32 +85,76 @@ class TimeSeries:
                 - `"zero"`: return `0.0`
                 - `"error"`: raise `ValueError`
         """
-        if t_s <= self.times_s[0]:
-            if extrapolation == "clamp":
-                return self.values[0]
-            if extrapolation == "zero":
-                return 0.0
-            raise ValueError(f"t_s={t_s} is before start of series")
-        if t_s >= self.times_s[-1]:
-            if extrapolation == "clamp":
-                return self.values[-1]
-            if extrapolation == "zero":
-                return 0.0
-            raise ValueError(f"t_s={t_s} is after end of series")
-
-        lo = 0
-        hi = len(self.times_s) - 1
-        while hi - lo > 1:
-            mid = (lo + hi) // 2
-            if self.times_s[mid] <= t_s:
-                lo = mid
+        t_first_s, t_last_s = self._span_s
+        if not t_first_s < t_s < t_last_s:
+            return self._extrapolate(t_s, extrapolation)
+
+        # `times_s[0] < t_s < times_s[-1]` here; find `hi` with `times_s[hi - 1] <= t_s <
+        # times_s[hi]` (i.e. `bisect_right`), trying the cached segment and its successor first.
+        times_s = self.times_s
+        hint = self._hint
+        hi = hint[0]
+        if times_s[hi - 1] <= t_s < times_s[hi]:
+            pass
+        elif hi + 1 < len(times_s) and times_s[hi] <= t_s < times_s[hi + 1]:
+            hi += 1
+        else:
+            hi = bisect_right(times_s, t_s)
+        hint[0] = hi
+        lo = hi - 1
+
+        return self.values[lo] + (t_s - times_s[lo]) * self._slopes[lo]
+
+    def _extrapolate(self, t_s: float, extrapolation: ExtrapolationMode) -> float:
+        """Out-of-range branch of `value_at` (`t_s` at or beyond either end of the series)."""
+        if t_s != t_s:
+            # NaN fails the range check too, but is not out of range: propagate it as
+            # the interpolation formula would, rather than clamping it to an endpoint.
+            return t_s
+        after = t_s >= self._span_s[1]
+        if extrapolation == "clamp":
+            return self.values[-1] if after else self.values[0]
+        if extrapolation == "zero":
+            return 0.0
+        raise ValueError(f"t_s={t_s} is after end of series" if after else f"t_s={t_s} is before start of series")
+
+    def value_at_many(
+        self, times_s: Sequence[float], *, extrapolation: ExtrapolationMode = "clamp"
+    ) -> list[float]:
+        """Return `value_at(t_s)` for every `t_s` in `times_s` (same results, one call).
+
+        Queries are expected in (mostly) increasing order, as on a simulation time
+        grid: the segment index then advances incrementally, so a whole schedule
+        costs `O(len(self.times_s) + len(times_s))` instead of one search per query.
+        Out-of-order queries fall back to a bisect.
+
+        Args:
+            times_s: Query times in seconds.
+            extrapolation: Out-of-range behavior, as in `value_at`.
+        """
+        # One C-level unpacking per call is cheaper than boxing on every index below.
+        knots_s = list(self.times_s)
+        values = list(self.values)
+        slopes = list(self._slopes)
+        t_first_s, t_last_s = self._span_s
+        out = [0.0] * len(times_s)
+        hi = 1
+        prev_t_s = t_first_s
+        for i, t_s in enumerate(times_s):
+            if not t_first_s < t_s < t_last_s:
+                out[i] = self._extrapolate(t_s, extrapolation)
+                continue
+            if t_s < prev_t_s:
+                hi = bisect_right(knots_s, t_s)
             else:
-                hi = mid
+                while knots_s[hi] <= t_s:
+                    hi += 1
+            prev_t_s = t_s
+            lo = hi - 1
+            out[i] = values[lo] + (t_s - knots_s[lo]) * slopes[lo]
+        return out
 
-        t0 = self.times_s[lo]
-        t1 = self.times_s[hi]
-        v0 = self.values[lo]
-        v1 = self.values[hi]
 
-        alpha = (t_s - t0) / (t1 - t0)
-        return v0 + alpha * (v1 - v0)
+def _segment_slopes(times_s: array[float], values: array[float]) -> array[float]:
+    """Per-segment slopes `(v[i+1] - v[i]) / (t[i+1] - t[i])`."""
+    return array("d", ((v1 - v0) / (t1 - t0) for t0, t1, v0, v1 in zip(times_s, times_s[1:], values, values[1:])))
@@ -8,14 +8,20 @@ Two sources are supported:
 from __future__ import annotations
 
 import csv
+import math
+from array import array
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from math import cos, pi
 from pathlib import Path
 from typing import Protocol, TypeAlias
 
+from passive_logic_simulator.file_stamp import FileStamp
 from passive_logic_simulator.time_series import ExtrapolationMode, TimeSeries
 
 SECONDS_PER_DAY = 24.0 * 3600.0
+TWO_PI = 2.0 * pi
 
 
 class Weather(Protocol):
@@ -26,7 +32,7 @@ class Weather(Protocol):
     def ambient_temperature_k(self, t_s: float) -> float: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SyntheticWeatherConfig:
     """Parameters for the built-in synthetic weather model."""
 
@@ -39,7 +45,7 @@ class SyntheticWeatherConfig:
     ambient_peak_s: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CsvWeatherConfig:
     """Parameters for a CSV-backed weather model."""
 
@@ -55,19 +61,31 @@ WeatherConfig: TypeAlias = SyntheticWeatherConfig | CsvWeatherConfig
 
 def irradiance_clear_day_w_m2(t_s: float, *, sunrise_s: float, sunset_s: float, peak_w_m2: float) -> float:
     """Simple clear-day irradiance curve (smooth bump between sunrise and sunset)."""
-    if t_s < sunrise_s or t_s > sunset_s:
+    return _clear_day_irradiance(t_s, sunrise_s, sunset_s, peak_w_m2)
+
+
+def ambient_sinusoid_k(t_s: float, *, mean_k: float, amplitude_k: float, period_s: float, peak_s: float) -> float:
+    """Simple ambient temperature model (cosine over `period_s` with a configurable peak time)."""
+    return _ambient_sinusoid(t_s, mean_k, amplitude_k, period_s, peak_s)
+
+
+def _clear_day_irradiance(t_s: float, sunrise_s: float, sunset_s: float, peak_w_m2: float, /) -> float:
+    """Positional-only body of `irradiance_clear_day_w_m2`, shared with `SyntheticWeather`."""
+    # The curve is 0 at both ends, so the endpoints take the early return too; this
+    # also keeps an empty (`sunset_s == sunrise_s`) or inverted window at 0.
+    if t_s <= sunrise_s or t_s >= sunset_s:
         return 0.0
     x = (t_s - sunrise_s) / (sunset_s - sunrise_s)
     # Raised cosine: 0 at sunrise/sunset, peak at midday, smooth endpoints.
-    return peak_w_m2 * (1.0 - cos(2.0 * pi * x)) / 2.0
+    return peak_w_m2 * (1.0 - cos(TWO_PI * x)) / 2.0
 
 
-def ambient_sinusoid_k(t_s: float, *, mean_k: float, amplitude_k: float, period_s: float, peak_s: float) -> float:
-    """Simple ambient temperature model (cosine over `period_s` with a configurable peak time)."""
-    return mean_k + amplitude_k * cos(2.0 * pi * (t_s - peak_s) / period_s)
+def _ambient_sinusoid(t_s: float, mean_k: float, amplitude_k: float, period_s: float, peak_s: float, /) -> float:
+    """Positional-only body of `ambient_sinusoid_k`, shared with `SyntheticWeather`."""
+    return mean_k + amplitude_k * cos(TWO_PI * (t_s - peak_s) / period_s)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SyntheticWeather:
     """Synthetic weather implementation."""
 
@@ -76,25 +94,28 @@ class SyntheticWeather:
     def irradiance_w_m2(self, t_s: float) -> float:
         # `sunrise_s` and `sunset_s` are defined as seconds from midnight, so the
         # clear-day irradiance curve should repeat every day.
-        t_day_s = t_s % SECONDS_PER_DAY
-        return irradiance_clear_day_w_m2(
-            t_day_s,
-            sunrise_s=self.config.sunrise_s,
-            sunset_s=self.config.sunset_s,
-            peak_w_m2=self.config.peak_irradiance_w_m2,
-        )
+        c = self.config
+        return _clear_day_irradiance(t_s % SECONDS_PER_DAY, c.sunrise_s, c.sunset_s, c.peak_irradiance_w_m2)
 
     def ambient_temperature_k(self, t_s: float) -> float:
-        return ambient_sinusoid_k(
-            t_s,
-            mean_k=self.config.ambient_mean_k,
-            amplitude_k=self.config.ambient_amplitude_k,
-            period_s=self.config.ambient_period_s,
-            peak_s=self.config.ambient_peak_s,
-        )
+        c = self.config
+        return _ambient_sinusoid(t_s, c.ambient_mean_k, c.ambient_amplitude_k, c.ambient_period_s, c.ambient_peak_s)
 
+    def irradiance_w_m2_many(self, times_s: Sequence[float]) -> list[float]:
+        """Batched `irradiance_w_m2` (config lookups hoisted out of the loop)."""
+        c = self.config
+        sunrise_s, sunset_s, peak_w_m2 = c.sunrise_s, c.sunset_s, c.peak_irradiance_w_m2
+        return [_clear_day_irradiance(t_s % SECONDS_PER_DAY, sunrise_s, sunset_s, peak_w_m2) for t_s in times_s]
 
-@dataclass(frozen=True)
+    def ambient_temperature_k_many(self, times_s: Sequence[float]) -> list[float]:
+        """Batched `ambient_temperature_k` (config lookups hoisted out of the loop)."""
+        c = self.config
+        mean_k, amplitude_k = c.ambient_mean_k, c.ambient_amplitude_k
+        period_s, peak_s = c.ambient_period_s, c.ambient_peak_s
+        return [_ambient_sinusoid(t_s, mean_k, amplitude_k, period_s, peak_s) for t_s in times_s]
+
+
+@dataclass(frozen=True, slots=True)
 class CsvWeather:
     """CSV weather implementation using piecewise-linear interpolation."""
 
@@ -108,36 +129,116 @@ class CsvWeather:
     def ambient_temperature_k(self, t_s: float) -> float:
         return self.ambient_temperature_k_series.value_at(t_s, extrapolation=self.extrapolation)
 
+    def irradiance_w_m2_many(self, times_s: Sequence[float]) -> list[float]:
+        """Batched `irradiance_w_m2` over a (typically increasing) schedule."""
+        return self.irradiance_w_m2_series.value_at_many(times_s, extrapolation=self.extrapolation)
+
+    def ambient_temperature_k_many(self, times_s: Sequence[float]) -> list[float]:
+        """Batched `ambient_temperature_k` over a (typically increasing) schedule."""
+        return self.ambient_temperature_k_series.value_at_many(times_s, extrapolation=self.extrapolation)
+
 
 def _read_csv_weather(config: CsvWeatherConfig) -> CsvWeather:
-    """Load weather time series from a CSV file into interpolatable structures."""
-    with config.csv_path.open(newline="") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-
-    times: list[float] = []
-    g: list[float] = []
-    t_amb_k: list[float] = []
-    for i, row in enumerate(rows, start=1):
-        try:
-            times.append(float(row[config.time_column]))
-            g.append(float(row[config.irradiance_column]))
-            t_amb_k.append(float(row[config.ambient_column]))
-        except KeyError as e:
-            raise ValueError(f"Missing column {e!s} in {config.csv_path}") from e
-        except ValueError as e:
-            raise ValueError(f"Invalid numeric value in {config.csv_path} at row {i}") from e
+    """Load weather time series from a CSV file into interpolatable structures.
+
+    Loaded weather is cached per file version (see `FileStamp`) and column/extrapolation settings.
+    """
+    return _read_csv_weather_cached(config, FileStamp.of(config.csv_path))
+
+
+@lru_cache(maxsize=32)
+def _read_csv_weather_cached(config: CsvWeatherConfig, stamp: FileStamp) -> CsvWeather:
+    """Parse the CSV behind `stamp` for `config` (memoized by `_read_csv_weather`)."""
+    # Accumulate in the storage type `TimeSeries` uses, so the columns are copied straight in.
+    times = array("d")
+    g = array("d")
+    t_amb_k = array("d")
+    with stamp.path.open(newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+
+        # Resolve column positions once so each row is indexed by position, not by name.
+        indices: list[int] = []
+        for column in (config.time_column, config.irradiance_column, config.ambient_column):
+            if column not in header:
+                raise ValueError(f"Missing column '{column}' in {config.csv_path}")
+            indices.append(header.index(column))
+        time_idx, irradiance_idx, ambient_idx = indices
+
+        # Rows are converted as they are read, so the raw text rows are never held in
+        # memory all at once. `filter(None, ...)` skips blank lines, as `csv.DictReader` does.
+        for i, row in enumerate(filter(None, reader), start=1):
+            try:
+                times.append(float(row[time_idx]))
+                g.append(float(row[irradiance_idx]))
+                t_amb_k.append(float(row[ambient_idx]))
+            except (IndexError, ValueError) as e:
+                raise ValueError(f"Invalid numeric value in {config.csv_path} at row {i}") from e
 
     if len(times) < 2:
         raise ValueError(f"{config.csv_path} must have at least 2 rows")
 
+    # Both channels share one validated time axis (see `TimeSeries.with_values`).
+    irradiance_series = TimeSeries(times_s=times, values=g)
     return CsvWeather(
-        irradiance_w_m2_series=TimeSeries(times_s=times, values=g),
-        ambient_temperature_k_series=TimeSeries(times_s=times, values=t_amb_k),
+        irradiance_w_m2_series=irradiance_series,
+        ambient_temperature_k_series=irradiance_series.with_values(t_amb_k),
         extrapolation=config.extrapolation,
     )
 
 
+def sample_weather(weather: Weather, times_s: Sequence[float]) -> tuple[list[float], list[float]]:
+    """Sample `G(t)` and `T_amb(t)` once for every time in `times_s`.
+
+    The built-in weather models are evaluated through their batched `*_many`
+    methods (CSV weather walks each series once, see `TimeSeries.value_at_many`;
+    synthetic weather hoists its config lookups out of the loop).
+
+    Returns:
+        A pair `(irradiance_w_m2, ambient_temperature_k)` aligned with `times_s`.
+    """
+    if isinstance(weather, (SyntheticWeather, CsvWeather)):
+        return weather.irradiance_w_m2_many(times_s), weather.ambient_temperature_k_many(times_s)
+    irradiance = weather.irradiance_w_m2
+    ambient = weather.ambient_temperature_k
+    return [irradiance(t_s) for t_s in times_s], [ambient(t_s) for t_s in times_s]
+
+
+def _sample_periodic(
+    fn_many: Callable[[Sequence[float]], list[float]], times_s: list[float], steps_per_period: float
+) -> list[float]:
+    """Sample `fn_many` on a uniform grid, evaluating only one period when it spans whole steps."""
+    period = int(round(steps_per_period))
+    if period < 1 or period >= len(times_s) or not math.isclose(steps_per_period, period, rel_tol=0.0, abs_tol=1e-9):
+        return fn_many(times_s)
+    one_period = fn_many(times_s[:period])
+    repeats, remainder = divmod(len(times_s), period)
+    return one_period * repeats + one_period[:remainder]
+
+
+def sample_weather_grid(
+    weather: Weather, t0_s: float, step_s: float, n_points: int
+) -> tuple[list[float], list[float]]:
+    """Sample `G(t)` and `T_amb(t)` on the uniform grid `t0_s + k*step_s`, `k < n_points`.
+
+    Synthetic weather is periodic (irradiance repeats daily, ambient temperature
+    every `ambient_period_s`). When a period is a whole number of grid steps, only
+    the first period is evaluated and its samples are repeated, so multi-day runs
+    pay the trig cost once.
+
+    Returns:
+        A pair `(irradiance_w_m2, ambient_temperature_k)` with `n_points` samples each.
+    """
+    times_s = [t0_s + k * step_s for k in range(n_points)]
+    if not isinstance(weather, SyntheticWeather):
+        return sample_weather(weather, times_s)
+    irradiance = _sample_periodic(weather.irradiance_w_m2_many, times_s, SECONDS_PER_DAY / step_s)
+    ambient = _sample_periodic(
+        weather.ambient_temperature_k_many, times_s, weather.config.ambient_period_s / step_s
+    )
+    return irradiance, ambient
+
+
 def build_weather(config: WeatherConfig) -> Weather:
     """Build a concrete `Weather` implementation from a weather config."""
     if isinstance(config, SyntheticWeatherConfig):
@@ -0,0 +1,127 @@
+"""Tests for the simulation API endpoints."""
+
+from __future__ import annotations
+
+import struct
+
+import pytest
+from fastapi.testclient import TestClient
+
+import passive_logic_simulator.api as api
+
+REQUEST = {"simulation": {"dt_s": 60.0, "duration_s": 3600.0}}
+
+
+def test_simulate_binary_matches_json_response() -> None:
+    client = TestClient(api.app)
+    json_data = client.post("/api/simulate", json=REQUEST).json()
+
+    response = client.post("/api/simulate.bin", json=REQUEST)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/octet-stream"
+
+    payload = response.content
+    (n,) = struct.unpack_from("<I", payload)
+    assert n == len(json_data["times_s"]) == 61
+    assert len(payload) == 8 + 8 * n + 12 * n + n
+    times_s = struct.unpack_from(f"<{n}d", payload, 8)
+    values = struct.unpack_from(f"<{3 * n}f{n}B", payload, 8 + 8 * n)
+    assert list(times_s) == json_data["times_s"]
+    assert list(values[:n]) == pytest.approx(json_data["tank_temperature_k"], abs=1e-4)
+    assert [bool(v) for v in values[3 * n :]] == json_data["pump_on"]
+
+
+def test_simulate_binary_keeps_full_time_resolution() -> None:
+    request = {"simulation": {"t0_s": 1.7e9, "dt_s": 60.0, "duration_s": 600.0}}
+    payload = TestClient(api.app).post("/api/simulate.bin", json=request).content
+    (n,) = struct.unpack_from("<I", payload)
+    times_s = struct.unpack_from(f"<{n}d", payload, 8)
+    assert list(times_s) == [1.7e9 + 60.0 * k for k in range(n)]
+
+
+def test_simulate_accepts_empty_daylight_window() -> None:
+    request = {**REQUEST, "weather": {"sunrise_s": 30000.0, "sunset_s": 30000.0}}
+    response = TestClient(api.app).post("/api/simulate", json=request)
+    assert response.status_code == 200
+    assert set(response.json()["irradiance_w_m2"]) == {0.0}
+
+
+def test_simulate_json_response_is_gzipped() -> None:
+    client = TestClient(api.app)
+    response = client.post("/api/simulate", json=REQUEST, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+
+
+def test_simulate_caches_identical_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    api._result_cache.clear()
+    calls: list[api.SimulationRequest] = []
+    run_request = api._run_request
+
+    def counting_run_request(sim_request: api.SimulationRequest) -> api.SimulationResult:
+        calls.append(sim_request)
+        return run_request(sim_request)
+
+    monkeypatch.setattr(api, "_run_request", counting_run_request)
+    client = TestClient(api.app)
+
+    first = client.post("/api/simulate", json=REQUEST)
+    second = client.post("/api/simulate", json=REQUEST)
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert first.headers["etag"] == second.headers["etag"]
+    assert len(calls) == 1
+
+    refreshed = client.post("/api/simulate?refresh=true", json=REQUEST)
+    assert refreshed.status_code == 200
+    assert len(calls) == 2
+
+    other = client.post("/api/simulate", json={"simulation": {"dt_s": 60.0, "duration_s": 7200.0}})
+    assert other.headers["etag"] != first.headers["etag"]
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize("endpoint", ["/api/simulate", "/api/simulate.bin"])
+def test_simulate_honors_if_none_match(monkeypatch: pytest.MonkeyPatch, endpoint: str) -> None:
+    api._result_cache.clear()
+    client = TestClient(api.app)
+    first = client.post(endpoint, json=REQUEST)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    calls: list[api.SimulationRequest] = []
+    run_request = api._run_request
+
+    def counting_run_request(sim_request: api.SimulationRequest) -> api.SimulationResult:
+        calls.append(sim_request)
+        return run_request(sim_request)
+
+    monkeypatch.setattr(api, "_run_request", counting_run_request)
+    not_modified = client.post(endpoint, json=REQUEST, headers={"If-None-Match": f'"other", {etag}'})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert calls == []
+
+    changed = {"simulation": {"dt_s": 120.0, "duration_s": 3600.0}}
+    assert client.post(endpoint, json=changed, headers={"If-None-Match": etag}).status_code == 200
+    assert len(calls) == 1
+
+
+def test_result_cache_is_bounded_by_total_samples() -> None:
+    result = api._run_request(api.SimulationRequest.model_validate(REQUEST))
+    n = len(result.times_s)
+    cache = api._ResultCache(max_entries=10, max_samples=2 * n)
+
+    cache.put("a", result)
+    cache.put("b", result)
+    assert cache.get("a") is result  # Now the most recently used entry.
+    cache.put("c", result)
+    assert cache.get("b") is None
+    assert cache.get("a") is cache.get("c") is result
+
+    # A result larger than the whole budget is never stored.
+    small = api._ResultCache(max_entries=10, max_samples=n - 1)
+    small.put("a", result)
+    assert small.get("a") is None
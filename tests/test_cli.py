@@ -35,6 +35,27 @@ def test_write_results_csv(tmp_path: Path) -> None:
     assert rows[1]["pump_on"] == "1"
 
 
+def test_write_results_csv_significant_digits(tmp_path: Path) -> None:
+    out_path = tmp_path / "out.csv"
+    _write_results_csv(
+        out_path,
+        times_s=[0.0, 86400.0],
+        tank_temperature_k=[300.0, 313.97287090575077],
+        ambient_temperature_k=[290.0, 290.0],
+        irradiance_w_m2=[0.0, 100.0],
+        pump_on=[False, True],
+        significant_digits=7,
+    )
+
+    with out_path.open(newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    assert rows[0]["time_s"] == "0"
+    assert rows[1]["time_s"] == "86400"
+    assert rows[1]["tank_temperature_k"] == "313.9729"
+    assert rows[1]["pump_on"] == "1"
+
+
 def test_cli_has_expected_commands() -> None:
     result = runner.invoke(app, ["--help"])
     assert result.exit_code == 0
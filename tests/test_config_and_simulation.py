@@ -1,13 +1,66 @@
 """Tests for config loading and end-to-end simulation behavior."""
 
+import dataclasses
+import math
 import textwrap
 from pathlib import Path
 from typing import Literal
 
 import pytest
 
-from passive_logic_simulator.config import load_config
-from passive_logic_simulator.simulation import run_simulation
+from passive_logic_simulator.config import SimulationConfig, load_config
+from passive_logic_simulator.control import update_pump_state
+from passive_logic_simulator.numerics import euler_step, rk4_step
+from passive_logic_simulator.physics import collector_outlet_k, collector_useful_heat_w, tank_dTdt_k_s
+from passive_logic_simulator.simulation import run_simulation, run_simulation_batch, validate_batch
+from passive_logic_simulator.weather import CsvWeatherConfig, build_weather
+
+DEFAULT_CONFIG = Path(__file__).resolve().parent.parent / "resources" / "default_config.toml"
+
+
+def _reference_tank_trajectory(config: SimulationConfig, solver: Literal["rk4", "euler"]) -> list[float]:
+    """Integrate the model step by step using the public physics/control helpers."""
+    weather = build_weather(config.weather)
+    n_steps = int(round(config.sim.duration_s / config.sim.dt_s))
+    t_tank_k = config.tank.initial_temperature_k
+    pump_on = False
+    trajectory: list[float] = []
+    for step in range(n_steps + 1):
+        t_s = config.sim.t0_s + step * config.sim.dt_s
+        pump_on = update_pump_state(
+            pump_on=pump_on,
+            t_tank_k=t_tank_k,
+            t_amb_outdoor_k=weather.ambient_temperature_k(t_s),
+            irradiance_w_m2=weather.irradiance_w_m2(t_s),
+            collector=config.collector,
+            pump=config.pump,
+            tank=config.tank,
+            control=config.control,
+        )
+        trajectory.append(t_tank_k)
+        m_dot_kg_s = config.pump.mass_flow_kg_s if pump_on else 0.0
+
+        def rhs(local_t_s: float, local_t_tank_k: float, *, m_dot_kg_s: float = m_dot_kg_s) -> float:
+            q_u_w = collector_useful_heat_w(
+                t_in_k=local_t_tank_k,
+                t_amb_outdoor_k=weather.ambient_temperature_k(local_t_s),
+                irradiance_w_m2=weather.irradiance_w_m2(local_t_s),
+                collector=config.collector,
+            )
+            t_out_k = collector_outlet_k(
+                t_in_k=local_t_tank_k, q_u_w=q_u_w, m_dot_kg_s=m_dot_kg_s, cp_j_kgk=config.tank.cp_j_kgk
+            )
+            return tank_dTdt_k_s(
+                t_tank_k=local_t_tank_k,
+                t_out_k=t_out_k,
+                t_room_k=config.tank.room_temperature_k,
+                m_dot_kg_s=m_dot_kg_s,
+                tank=config.tank,
+            )
+
+        step_fn = rk4_step if solver == "rk4" else euler_step
+        t_tank_k = step_fn(t_s, t_tank_k, config.sim.dt_s, rhs)
+    return trajectory
 
 
 def test_load_config_rejects_invalid_weather_extrapolation(tmp_path: Path) -> None:
@@ -31,9 +84,35 @@ def test_load_config_rejects_invalid_weather_extrapolation(tmp_path: Path) -> No
         load_config(toml_path)
 
 
-@pytest.mark.parametrize("solver", ["rk4", "euler"])
+def test_load_config_is_cached_until_file_changes(tmp_path: Path) -> None:
+    toml_path = tmp_path / "config.toml"
+    toml_path.write_text("[tank]\nmass_kg = 100.0\n", encoding="utf-8")
+    first = load_config(toml_path)
+    assert load_config(str(toml_path)) is first
+
+    # Different size too, so the change is seen even on coarse-timestamp filesystems.
+    toml_path.write_text("[tank]\nmass_kg = 2500.0\n", encoding="utf-8")
+    assert load_config(toml_path).tank.mass_kg == 2500.0
+
+
+def test_load_config_resolves_csv_path_next_to_symlinked_config(tmp_path: Path) -> None:
+    real_dir = tmp_path / "real"
+    link_dir = tmp_path / "link"
+    real_dir.mkdir()
+    link_dir.mkdir()
+    (real_dir / "config.toml").write_text('[weather]\nkind = "csv"\ncsv_path = "weather.csv"\n', encoding="utf-8")
+    (link_dir / "config.toml").symlink_to(real_dir / "config.toml")
+
+    config = load_config(link_dir / "config.toml")
+    assert isinstance(config.weather, CsvWeatherConfig)
+    assert config.weather.csv_path == (link_dir / "weather.csv").resolve()
+    # Same file version, different directory: not served from the other entry.
+    assert load_config(real_dir / "config.toml").weather.csv_path == (real_dir / "weather.csv").resolve()
+
+
+@pytest.mark.parametrize("solver", ["rk4", "euler", "analytic"])
 def test_run_simulation_constant_inputs_matches_linear_solution(
-    tmp_path: Path, solver: Literal["rk4", "euler"]
+    tmp_path: Path, solver: Literal["rk4", "euler", "analytic"]
 ) -> None:
     # Create constant weather so collector heat is constant.
     weather_csv = tmp_path / "weather.csv"
@@ -97,6 +176,62 @@ def test_run_simulation_constant_inputs_matches_linear_solution(
     assert result.tank_temperature_k[-1] == pytest.approx(expected_final, abs=0.0)
 
 
+def test_run_simulation_pump_off_matches_exponential_decay(tmp_path: Path) -> None:
+    config_toml = tmp_path / "config.toml"
+    config_toml.write_text(
+        textwrap.dedent(
+            """
+            [tank]
+            mass_kg = 10.0
+            cp_j_kgk = 100.0
+            ua_w_k = 5.0
+            initial_temperature_k = 350.0
+            room_temperature_k = 290.0
+
+            [simulation]
+            dt_s = 60.0
+            duration_s = 3600.0
+
+            [weather]
+            kind = "synthetic"
+            peak_irradiance_w_m2 = 0.0
+            """
+        ).strip()
+        + "\n",
+        encoding="utf-8",
+    )
+    config = load_config(config_toml)
+    result = run_simulation(config)
+
+    assert not any(result.pump_on)
+    rate_1_s = config.tank.ua_w_k / (config.tank.mass_kg * config.tank.cp_j_kgk)
+    for t_s, t_tank_k in zip(result.times_s, result.tank_temperature_k):
+        assert t_tank_k == pytest.approx(290.0 + 60.0 * math.exp(-rate_1_s * t_s), abs=1e-9)
+
+
+def test_run_simulation_time_grid_does_not_drift(tmp_path: Path) -> None:
+    config_toml = tmp_path / "config.toml"
+    config_toml.write_text(
+        textwrap.dedent(
+            """
+            [simulation]
+            t0_s = 0.0
+            dt_s = 0.1
+            duration_s = 1000.0
+            """
+        ).strip()
+        + "\n",
+        encoding="utf-8",
+    )
+    config = load_config(config_toml)
+    result = run_simulation(config, solver="euler")
+
+    # Accumulating `t += dt` would drift by many ULPs over 10^4 steps.
+    assert len(result.times_s) == 10001
+    assert result.times_s[-1] == 1000.0
+    assert all(t_s == i * 0.1 for i, t_s in enumerate(result.times_s))
+
+
 def test_run_simulation_requires_duration_multiple_of_dt(tmp_path: Path) -> None:
     config_toml = tmp_path / "config.toml"
     config_toml.write_text(
@@ -113,3 +248,167 @@ def test_run_simulation_requires_duration_multiple_of_dt(tmp_path: Path) -> None
     config = load_config(config_toml)
     with pytest.raises(ValueError, match="duration_s must be an integer multiple"):
         run_simulation(config)
+
+
+@pytest.mark.parametrize("solver", ["rk4", "euler"])
+def test_run_simulation_matches_reference_integration(solver: Literal["rk4", "euler"]) -> None:
+    config = load_config(DEFAULT_CONFIG)
+    result = run_simulation(config, solver=solver)
+    expected = _reference_tank_trajectory(config, solver)
+
+    assert any(result.pump_on) and not all(result.pump_on)
+    assert result.tank_temperature_k == pytest.approx(expected, abs=1e-6)
+
+
+def test_run_simulation_batch_matches_individual_runs() -> None:
+    base = load_config(DEFAULT_CONFIG)
+    configs = [
+        base,
+        dataclasses.replace(base, collector=dataclasses.replace(base.collector, area_m2=4.0)),
+        dataclasses.replace(base, sim=dataclasses.replace(base.sim, dt_s=60.0)),
+    ]
+
+    results = run_simulation_batch(configs)
+
+    assert len(results) == len(configs)
+    for config, result in zip(configs, results):
+        assert result == run_simulation(config)
+    assert results[1].tank_temperature_k[-1] > results[0].tank_temperature_k[-1]
+
+
+def test_run_simulation_batch_with_workers_matches_serial() -> None:
+    base = load_config(DEFAULT_CONFIG)
+    configs = [
+        dataclasses.replace(base, collector=dataclasses.replace(base.collector, area_m2=area_m2))
+        for area_m2 in (1.0, 2.0, 3.0)
+    ]
+
+    assert run_simulation_batch(configs, max_workers=2) == run_simulation_batch(configs)
+    with pytest.raises(ValueError, match="max_workers"):
+        run_simulation_batch(configs, max_workers=0)
+
+
+def test_validate_batch_reports_first_invalid_config() -> None:
+    base = load_config(DEFAULT_CONFIG)
+    bad = dataclasses.replace(base, sim=dataclasses.replace(base.sim, duration_s=base.sim.duration_s + 1.0))
+
+    validate_batch([base, base])
+    with pytest.raises(ValueError, match=r"configs\[2\]: simulation.duration_s must be an integer multiple"):
+        validate_batch([base, base, bad])
+    with pytest.raises(ValueError, match=r"configs\[1\]"):
+        run_simulation_batch([base, bad])
+
+
+def test_run_simulation_dopri5_matches_rk4() -> None:
+    config = load_config(DEFAULT_CONFIG)
+    rk4 = run_simulation(config, solver="rk4")
+    dopri5 = run_simulation(config, solver="dopri5")
+
+    assert dopri5.times_s == rk4.times_s
+    assert dopri5.pump_on == rk4.pump_on
+    assert dopri5.tank_temperature_k == pytest.approx(rk4.tank_temperature_k, abs=1e-4)
+
+
+def test_run_simulation_analytic_is_exact_for_constant_weather(tmp_path: Path) -> None:
+    weather_csv = tmp_path / "weather.csv"
+    weather_csv.write_text(
+        "time_s,irradiance_w_m2,ambient_k\n0,800,290\n86400,800,290\n",
+        encoding="utf-8",
+    )
+    config_toml = tmp_path / "config.toml"
+    config_toml.write_text(
+        textwrap.dedent(
+            f"""
+            [tank]
+            initial_temperature_k = 300.0
+            room_temperature_k = 295.0
+
+            [control]
+            enabled = false
+
+            [simulation]
+            dt_s = 600.0
+            duration_s = 86400.0
+
+            [weather]
+            kind = "csv"
+            csv_path = "{weather_csv.as_posix()}"
+            """
+        ).strip()
+        + "\n",
+        encoding="utf-8",
+    )
+    config = load_config(config_toml)
+    result = run_simulation(config, solver="analytic")
+
+    # dT/dt = alpha - beta*T with constant coefficients while Q_u > 0.
+    collector, tank = config.collector, config.tank
+    m_cp = tank.mass_kg * tank.cp_j_kgk
+    a_fr = collector.area_m2 * collector.heat_removal_factor
+    beta_1_s = (a_fr * collector.loss_coefficient_w_m2k + tank.ua_w_k) / m_cp
+    alpha_k_s = (
+        a_fr * (collector.optical_efficiency * 800.0 + collector.loss_coefficient_w_m2k * 290.0)
+        + tank.ua_w_k * tank.room_temperature_k
+    ) / m_cp
+    t_inf_k = alpha_k_s / beta_1_s
+    for t_s, t_tank_k in zip(result.times_s, result.tank_temperature_k):
+        assert t_tank_k == pytest.approx(t_inf_k + (300.0 - t_inf_k) * math.exp(-beta_1_s * t_s), abs=1e-9)
+
+
+def test_run_simulation_analytic_is_accurate_for_tiny_decay_rates(tmp_path: Path) -> None:
+    weather_csv = tmp_path / "weather.csv"
+    weather_csv.write_text("time_s,irradiance_w_m2,ambient_k\n0,100,300\n100,100,300\n", encoding="utf-8")
+    config_toml = tmp_path / "config.toml"
+    # beta = UA/(m*c_p) = 1e-8 1/s: `T_inf = alpha/beta` would be ~1e8 K.
+    config_toml.write_text(
+        textwrap.dedent(
+            f"""
+            [collector]
+            area_m2 = 1.0
+            heat_removal_factor = 1.0
+            optical_efficiency = 1.0
+            loss_coefficient_w_m2k = 0.0
+
+            [tank]
+            mass_kg = 10.0
+            cp_j_kgk = 10.0
+            ua_w_k = 1e-6
+            initial_temperature_k = 300.0
+            room_temperature_k = 300.0
+
+            [control]
+            enabled = false
+
+            [simulation]
+            dt_s = 1.0
+            duration_s = 10.0
+
+            [weather]
+            kind = "csv"
+            csv_path = "{weather_csv.as_posix()}"
+            """
+        ).strip()
+        + "\n",
+        encoding="utf-8",
+    )
+    result = run_simulation(load_config(config_toml), solver="analytic")
+
+    # dT/dt = 1 K/s - beta*(T - 300 K), starting at 300 K.
+    beta_1_s = 1e-8
+    for t_s, t_tank_k in zip(result.times_s, result.tank_temperature_k):
+        assert t_tank_k == pytest.approx(300.0 - math.expm1(-beta_1_s * t_s) / beta_1_s, abs=1e-11)
+
+
+def test_run_simulation_analytic_matches_rk4() -> None:
+    config = load_config(DEFAULT_CONFIG)
+    rk4 = run_simulation(config, solver="rk4")
+    analytic = run_simulation(config, solver="analytic")
+
+    assert analytic.pump_on == rk4.pump_on
+    assert analytic.tank_temperature_k == pytest.approx(rk4.tank_temperature_k, abs=1e-4)
+
+
+def test_run_simulation_rejects_unknown_solver() -> None:
+    config = load_config(DEFAULT_CONFIG)
+    with pytest.raises(ValueError, match="solver must be one of"):
+        run_simulation(config, solver="midpoint")  # type: ignore[arg-type]
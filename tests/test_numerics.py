@@ -2,7 +2,7 @@
 
 import math
 
-from passive_logic_simulator.numerics import euler_step, rk4_step
+from passive_logic_simulator.numerics import dopri5_step, euler_step, hermite_interpolate, rk4_step
 
 
 def test_rk4_step_matches_exponential_growth() -> None:
@@ -17,3 +17,18 @@ def test_euler_step_matches_constant_derivative() -> None:
     dt = 0.1
     y1 = euler_step(0.0, 1.0, dt, lambda _t, _y: 2.0)
     assert y1 == 1.2
+
+
+def test_dopri5_step_matches_exponential_growth_and_reports_small_error() -> None:
+    dt = 0.1
+    y1, dydt1, error = dopri5_step(0.0, 1.0, dt, lambda _t, y: y, 1.0)
+    assert math.isclose(y1, math.exp(dt), rel_tol=0.0, abs_tol=1e-9)
+    # First-same-as-last: the returned slope is f(t + dt, y1).
+    assert dydt1 == y1
+    assert 0.0 < abs(error) < 1e-7
+
+
+def test_hermite_interpolate_is_exact_for_cubics() -> None:
+    # y = t^3 on [1, 2]: endpoint values and slopes determine the cubic exactly.
+    y = hermite_interpolate(1.5, 1.0, 1.0, 3.0, 2.0, 8.0, 12.0)
+    assert math.isclose(y, 1.5**3)
@@ -51,3 +51,4 @@ def test_simulation_params_validate_dt_and_duration() -> None:
 
     with pytest.raises(ValueError, match="simulation.duration_s"):
         SimulationParams(t0_s=0.0, dt_s=1.0, duration_s=-1.0)
+
@@ -2,10 +2,13 @@
 
 import math
 
+import pytest
+
 from passive_logic_simulator.params import CollectorParams, TankParams
 from passive_logic_simulator.physics import (
     clamp_min,
     collector_outlet_k,
+    collector_useful_heat_from_coeffs_w,
     collector_useful_heat_w,
     tank_dTdt_k_s,
 )
@@ -29,6 +32,21 @@ def test_collector_useful_heat_clamps_to_non_negative() -> None:
     assert q_u == 0.0
 
 
+def test_collector_useful_heat_from_coeffs_matches_public_helper() -> None:
+    collector = CollectorParams(
+        area_m2=2.5,
+        heat_removal_factor=0.8,
+        optical_efficiency=0.7,
+        loss_coefficient_w_m2k=4.0,
+    )
+    for t_in_k, t_amb_k, g in [(310.0, 290.0, 800.0), (330.0, 280.0, 50.0), (300.0, 300.0, 0.0)]:
+        expected = collector_useful_heat_w(
+            t_in_k=t_in_k, t_amb_outdoor_k=t_amb_k, irradiance_w_m2=g, collector=collector
+        )
+        q_u = collector_useful_heat_from_coeffs_w(t_in_k, t_amb_k, g, 2.5 * 0.8 * 0.7, 2.5 * 0.8 * 4.0)
+        assert q_u == pytest.approx(expected)
+
+
 def test_collector_outlet_handles_no_flow() -> None:
     assert collector_outlet_k(t_in_k=300.0, q_u_w=100.0, m_dot_kg_s=0.0, cp_j_kgk=4180.0) == 300.0
 
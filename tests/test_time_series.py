@@ -1,8 +1,10 @@
 """Tests for the `TimeSeries` interpolation utility."""
 
+import math
+
 import pytest
 
-from passive_logic_simulator.time_series import TimeSeries
+from passive_logic_simulator.time_series import ExtrapolationMode, TimeSeries
 
 
 def test_time_series_requires_same_length() -> None:
@@ -43,3 +45,64 @@ def test_time_series_extrapolation_modes() -> None:
         ts.value_at(-1.0, extrapolation="error")
     with pytest.raises(ValueError, match="after end"):
         ts.value_at(11.0, extrapolation="error")
+
+
+def test_time_series_interpolates_on_non_uniform_grid() -> None:
+    ts = TimeSeries(times_s=[0.0, 1.0, 3.0, 7.0, 8.0], values=[0.0, 2.0, 0.0, 4.0, 4.0])
+
+    assert ts.value_at(0.5) == 1.0
+    assert ts.value_at(1.0) == 2.0
+    assert ts.value_at(2.0) == 1.0
+    assert ts.value_at(6.0) == 3.0
+    assert ts.value_at(7.5) == 4.0
+
+
+@pytest.mark.parametrize("extrapolation", ["clamp", "zero"])
+def test_time_series_value_at_many_matches_value_at(extrapolation: ExtrapolationMode) -> None:
+    ts = TimeSeries(times_s=[0.0, 1.0, 3.0, 7.0, 8.0], values=[0.0, 2.0, 0.5, 4.0, 4.0])
+    # Increasing grid (incremental walk), then out-of-order and out-of-range queries.
+    queries = [-1.0 + 0.25 * i for i in range(41)] + [5.5, 0.3, 7.9, 2.0, 100.0, 0.0]
+
+    expected = [ts.value_at(t_s, extrapolation=extrapolation) for t_s in queries]
+
+    assert ts.value_at_many(queries, extrapolation=extrapolation) == expected
+
+
+def test_time_series_value_at_many_error_mode() -> None:
+    ts = TimeSeries(times_s=[0.0, 10.0], values=[1.0, 3.0])
+
+    assert ts.value_at_many([2.0, 5.0], extrapolation="error") == [1.4, 2.0]
+    with pytest.raises(ValueError, match="after end"):
+        ts.value_at_many([5.0, 11.0], extrapolation="error")
+
+
+def test_time_series_value_at_is_independent_of_query_order() -> None:
+    ts = TimeSeries(times_s=[0.0, 1.0, 3.0, 7.0, 8.0], values=[0.0, 2.0, 0.5, 4.0, 4.0])
+    queries = [0.5, 0.9, 1.0, 2.0, 3.5, 7.5, 0.2, 7.99, 1.5, 1.5, 6.0]
+
+    forward = [ts.value_at(t_s) for t_s in queries]
+    fresh = [TimeSeries(times_s=ts.times_s, values=ts.values).value_at(t_s) for t_s in queries]
+
+    assert forward == fresh
+
+
+def test_with_values_shares_the_time_axis() -> None:
+    ts = TimeSeries(times_s=[0.0, 10.0, 20.0], values=[0.0, 10.0, 0.0])
+    assert ts.value_at(15.0) == 5.0
+    other = ts.with_values([1.0, 3.0, 7.0])
+    assert other.times_s is ts.times_s
+    assert other.value_at(15.0) == 5.0
+    assert other.value_at(25.0) == 7.0
+    assert other == TimeSeries(times_s=[0.0, 10.0, 20.0], values=[1.0, 3.0, 7.0])
+    # The original series is left untouched.
+    assert ts.value_at(15.0) == 5.0
+
+    with pytest.raises(ValueError, match="same length"):
+        ts.with_values([1.0, 2.0])
+
+
+@pytest.mark.parametrize("mode", ["clamp", "zero", "error"])
+def test_nan_query_propagates(mode: ExtrapolationMode) -> None:
+    ts = TimeSeries(times_s=[0.0, 10.0], values=[1.0, 2.0])
+    assert math.isnan(ts.value_at(math.nan, extrapolation=mode))
+    assert math.isnan(ts.value_at_many([5.0, math.nan], extrapolation=mode)[1])
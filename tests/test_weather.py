@@ -7,10 +7,13 @@ import pytest
 
 from passive_logic_simulator.weather import (
     CsvWeatherConfig,
+    SyntheticWeather,
     SyntheticWeatherConfig,
     ambient_sinusoid_k,
     build_weather,
     irradiance_clear_day_w_m2,
+    sample_weather,
+    sample_weather_grid,
 )
 
 
@@ -19,6 +22,12 @@ def test_irradiance_clear_day_is_zero_outside_window() -> None:
     assert irradiance_clear_day_w_m2(25.0, sunrise_s=10.0, sunset_s=20.0, peak_w_m2=100.0) == 0.0
 
 
+def test_irradiance_clear_day_is_zero_for_empty_or_inverted_window() -> None:
+    for t_s in (0.0, 10.0, 15.0, 20.0, 25.0):
+        assert irradiance_clear_day_w_m2(t_s, sunrise_s=10.0, sunset_s=10.0, peak_w_m2=100.0) == 0.0
+        assert irradiance_clear_day_w_m2(t_s, sunrise_s=20.0, sunset_s=10.0, peak_w_m2=100.0) == 0.0
+
+
 def test_irradiance_clear_day_is_zero_at_endpoints_and_peaks_midday() -> None:
     sunrise_s = 10.0
     sunset_s = 20.0
@@ -81,8 +90,133 @@ def test_build_weather_csv(tmp_path: Path) -> None:
     assert w.ambient_temperature_k(5.0) == 305.0
 
 
+def test_build_weather_csv_reports_missing_columns_and_bad_rows(tmp_path: Path) -> None:
+    csv_path = tmp_path / "weather.csv"
+    csv_path.write_text("time_s,irradiance_w_m2\n0,0\n10,10\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Missing column 'ambient_k'"):
+        build_weather(CsvWeatherConfig(csv_path=csv_path))
+
+    csv_path = tmp_path / "short_row.csv"
+    csv_path.write_text("time_s,irradiance_w_m2,ambient_k\n0,0,300\n\n10,10\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="at row 2"):
+        build_weather(CsvWeatherConfig(csv_path=csv_path))
+
+
+def test_build_weather_csv_is_cached_until_file_changes(tmp_path: Path) -> None:
+    csv_path = tmp_path / "weather.csv"
+    csv_path.write_text("time_s,irradiance_w_m2,ambient_k\n0,0,300\n10,10,310\n", encoding="utf-8")
+    config = CsvWeatherConfig(csv_path=csv_path)
+    first = build_weather(config)
+    assert build_weather(CsvWeatherConfig(csv_path=csv_path)) is first
+
+    csv_path.write_text("time_s,irradiance_w_m2,ambient_k\n0,0,300\n10,100,310\n", encoding="utf-8")
+    assert build_weather(config).irradiance_w_m2(5.0) == 50.0
+
+
 def test_build_weather_csv_requires_enough_rows(tmp_path: Path) -> None:
     csv_path = tmp_path / "weather.csv"
     csv_path.write_text("time_s,irradiance_w_m2,ambient_k\n0,0,300\n", encoding="utf-8")
     with pytest.raises(ValueError, match="at least 2 rows"):
         build_weather(CsvWeatherConfig(csv_path=csv_path))
+
+
+def test_sample_weather_matches_scalar_queries() -> None:
+    w = build_weather(
+        SyntheticWeatherConfig(
+            sunrise_s=10.0,
+            sunset_s=20.0,
+            peak_irradiance_w_m2=100.0,
+            ambient_mean_k=300.0,
+            ambient_amplitude_k=5.0,
+            ambient_period_s=100.0,
+            ambient_peak_s=25.0,
+        )
+    )
+    times_s = [0.0, 12.5, 15.0, 25.0, 75.0]
+    g, t_amb = sample_weather(w, times_s)
+    assert g == [w.irradiance_w_m2(t) for t in times_s]
+    assert t_amb == [w.ambient_temperature_k(t) for t in times_s]
+
+
+def test_synthetic_weather_batched_methods_match_scalar_methods() -> None:
+    w = SyntheticWeather(
+        SyntheticWeatherConfig(
+            sunrise_s=21600.0,
+            sunset_s=64800.0,
+            peak_irradiance_w_m2=850.0,
+            ambient_mean_k=293.15,
+            ambient_amplitude_k=6.0,
+            ambient_period_s=86400.0,
+            ambient_peak_s=54000.0,
+        )
+    )
+    times_s = [-3600.0 + k * 937.5 for k in range(300)]
+    assert w.irradiance_w_m2_many(times_s) == [w.irradiance_w_m2(t) for t in times_s]
+    assert w.ambient_temperature_k_many(times_s) == [w.ambient_temperature_k(t) for t in times_s]
+
+    c = w.config
+    assert [w.irradiance_w_m2(t) for t in times_s] == [
+        irradiance_clear_day_w_m2(
+            t % 86400.0, sunrise_s=c.sunrise_s, sunset_s=c.sunset_s, peak_w_m2=c.peak_irradiance_w_m2
+        )
+        for t in times_s
+    ]
+    assert [w.ambient_temperature_k(t) for t in times_s] == [
+        ambient_sinusoid_k(
+            t,
+            mean_k=c.ambient_mean_k,
+            amplitude_k=c.ambient_amplitude_k,
+            period_s=c.ambient_period_s,
+            peak_s=c.ambient_peak_s,
+        )
+        for t in times_s
+    ]
+
+
+def test_synthetic_weather_empty_or_inverted_window_has_no_sun() -> None:
+    times_s = [k * 900.0 for k in range(96)]
+    for sunrise_s, sunset_s in ((30000.0, 30000.0), (64800.0, 21600.0)):
+        w = SyntheticWeather(
+            SyntheticWeatherConfig(
+                sunrise_s=sunrise_s,
+                sunset_s=sunset_s,
+                peak_irradiance_w_m2=850.0,
+                ambient_mean_k=293.15,
+                ambient_amplitude_k=6.0,
+                ambient_period_s=86400.0,
+                ambient_peak_s=54000.0,
+            )
+        )
+        assert w.irradiance_w_m2(sunrise_s) == 0.0
+        assert w.irradiance_w_m2_many(times_s) == [0.0] * len(times_s)
+
+
+def test_sample_weather_grid_reuses_periods_for_synthetic_weather() -> None:
+    w = build_weather(
+        SyntheticWeatherConfig(
+            sunrise_s=21600.0,
+            sunset_s=64800.0,
+            peak_irradiance_w_m2=850.0,
+            ambient_mean_k=293.15,
+            ambient_amplitude_k=6.0,
+            ambient_period_s=43200.0,
+            ambient_peak_s=54000.0,
+        )
+    )
+    # Three days at 15 min with an offset start; both periods span whole steps.
+    t0_s = 450.0
+    step_s = 900.0
+    n_points = 3 * 96 + 5
+    g, t_amb = sample_weather_grid(w, t0_s, step_s, n_points)
+
+    times_s = [t0_s + k * step_s for k in range(n_points)]
+    g_direct, t_amb_direct = sample_weather(w, times_s)
+    assert g == pytest.approx(g_direct, abs=1e-9)
+    assert t_amb == pytest.approx(t_amb_direct, abs=1e-9)
+
+
+def test_sample_weather_grid_csv_matches_scalar_queries(tmp_path: Path) -> None:
+    csv_path = tmp_path / "weather.csv"
+    csv_path.write_text("time_s,irradiance_w_m2,ambient_k\n0,0,300\n10,10,310\n", encoding="utf-8")
+    w = build_weather(CsvWeatherConfig(csv_path=csv_path))
+    assert sample_weather_grid(w, 0.0, 2.5, 5) == ([0.0, 2.5, 5.0, 7.5, 10.0], [300.0, 302.5, 305.0, 307.5, 310.0])